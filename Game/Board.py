@@ -1,4 +1,29 @@
 import tkinter as tk   # import Tkinter library to build the graphical interface (GUI)
+import tkinter.font as tkfont
+import numpy as np
+
+from Strategies.jit import njit
+
+
+# cell layout per board size: (largest board size, (cell width px, cell height px, font size, padding px))
+SIZE_TIERS = [
+    (5, (110, 80, 16, 3)),
+    (8, (80, 56, 14, 2)),
+    (10, (56, 48, 12, 1)),  # for 9x9 or 10x10 boards
+]
+
+
+@njit(cache=True)
+def _legal_mask(taken, row, col):
+    """
+    Cells the next player may choose after a move in (row, col):
+    the free cells of that row and that column.
+    """
+    mask = np.zeros_like(taken)
+    mask[row, :] = ~taken[row, :]
+    mask[:, col] = ~taken[:, col]
+    return mask
+
 
 class Board:
     """ The Board class is responsible for creating and managing the Graphical User Interface (GUI)
@@ -7,28 +32,43 @@ class Board:
 
         It establishes a direct connection with the GameHandler to:
         1. Retrieve game state information (like player names, scores, and the matrix values).
-        2. Notify the GameHandler when a cell (button) is clicked.
+        2. Notify the GameHandler when a cell is clicked.
         3. Update the visual elements based on game events, such as refreshing scores,
-           highlighting the current player, and enabling/disabling buttons to enforce
+           highlighting the current player, and enabling/disabling cells to enforce
            the game's move rules (limiting clicks to the same row or column as the last move).
         """
 
+    # color palette (shared by every Board, so it lives on the class)
+    COLOR_BG = "#F8C8DC"  # for board
+    COLOR_BTN = "#FFF4F7"  # for cells
+    COLOR_TEXT = "#111111"  # for text
+    ACCENT_P1 = "#E36BAE"  # player one
+    ACCENT_P1_SOFT = "#F6C3DB"  # soft border p1
+    ACCENT_P2 = "#B36DE3"  # player 2
+    ACCENT_P2_SOFT = "#D9C3F6"  # soft border p2
+    COLOR_CLICKED = "#D988B9"  # for clicked cells
+    COLOR_DISABLED = "#A3A3A3"  # for text of cells that cannot be clicked
+
+    # fixed attribute layout: no per-instance __dict__ and faster attribute access in the hot paths
+    __slots__ = (
+        # references
+        "game_handler", "root",
+        # widgets and fonts
+        "title_canvas", "p1_wrap", "p2_wrap", "player1_label", "player2_label", "_name_vars",
+        "font_label_bold", "font_label_normal", "font_cell", "grid_frame", "grid_canvas",
+        # grid layout and state
+        "grid_rects", "grid_texts", "cell_step_x", "cell_step_y",
+        "_enabled_mask", "_state_cmds", "_taken_cmds", "_grid_ready",
+        # cached highlight/score rendering
+        "_hl_scripts", "_last_highlighted", "_last_scores",
+    )
+
     def __init__(self, game_handler):
         # References
         # direct reference to GameHandler
         self.game_handler = game_handler
         self.root = game_handler.root
 
-        # color palette
-        self.COLOR_BG = "#F8C8DC"  # for board
-        self.COLOR_BTN = "#FFF4F7"  # for buttons
-        self.COLOR_TEXT = "#111111"  # for text
-        self.ACCENT_P1 = "#E36BAE"  # player one
-        self.ACCENT_P1_SOFT = "#F6C3DB"  # soft border p1
-        self.ACCENT_P2 = "#B36DE3"  # player 2
-        self.ACCENT_P2_SOFT = "#D9C3F6"  # soft border p2
-        self.COLOR_CLICKED = "#D988B9"  # for clicked cells
-
         #  Setup window
         try:
             self.root.state("zoomed")  # Windows fullscreen
@@ -47,7 +87,15 @@ class Board:
         # render outlined "RC GAME" title text on the canvas
         self._draw_outlined_title(self.title_canvas, "RC GAME", y=35)
 
+        # font objects shared by the score labels, so Tk does not re-parse a font tuple on every turn swap
+        self.font_label_bold = tkfont.Font(root=self.root, family="Helvetica", size=14, weight="bold")
+        self.font_label_normal = tkfont.Font(root=self.root, family="Helvetica", size=14, weight="normal")
+
         #Scores
+        # player names live in Tcl variables, so the per-move script can refer to them
+        # without quoting user input into the script text
+        self._name_vars = tuple(tk.StringVar(self.root, value=p.getName()) for p in self.game_handler.players)
+
         # container frame to hold both players' score displays
         score_frame = tk.Frame(self.root, bg=self.COLOR_BG)
         score_frame.pack(side=tk.TOP, fill=tk.X, pady=6)
@@ -61,7 +109,7 @@ class Board:
         self.player1_label = tk.Label(
             self.p1_wrap,
             text=f"{self.game_handler.players[0].getName()}: 0",
-            font=("Helvetica", 14, "bold"),
+            font=self.font_label_bold,
             bg=self.COLOR_BG,
             fg=self.COLOR_TEXT,
             width=16,
@@ -78,7 +126,7 @@ class Board:
         self.player2_label = tk.Label(
             self.p2_wrap,
             text=f"{self.game_handler.players[1].getName()}: 0",
-            font=("Helvetica", 14, "bold"),
+            font=self.font_label_bold,
             bg=self.COLOR_BG,
             fg=self.COLOR_TEXT,
             width=16,
@@ -87,15 +135,59 @@ class Board:
         self.player2_label.pack()
 
         # Grid
-        #frame that will contain the matrix of clickable buttons (game board)
+        #frame that will contain the canvas with the clickable cells (game board)
         self.grid_frame = tk.Frame(self.root, bg=self.COLOR_BG)
         self.grid_frame.pack(expand=True)
 
-        # 2D list to store references to each button, aligned with matrix coordinates
-        self.grid_buttons = []
+        # N x N arrays with the canvas item ids of each cell, aligned with matrix coordinates (set in create_grid)
+        self.grid_rects = None
+        self.grid_texts = None
+        # the grid itself is built lazily (see _build_deferred) so the window can map first
+        self._grid_ready = False
+
+        # the highlight only has two looks ("P1 active" / "P2 active"): build their configurations once
+        # each entry holds the options for (p1_wrap, player1_label, p2_wrap, player2_label)
+        active_label = {"bg": self.COLOR_BTN, "fg": self.COLOR_TEXT, "font": self.font_label_bold}
+        inactive_label = {"bg": self.COLOR_BG, "fg": self.COLOR_TEXT, "font": self.font_label_normal}
+        hl_states = [
+            ({"bg": self.ACCENT_P1, "highlightbackground": self.ACCENT_P1, "highlightthickness": 2, "bd": 0},
+             active_label,
+             {"bg": self.ACCENT_P2_SOFT, "highlightthickness": 0, "bd": 0},
+             inactive_label),
+            ({"bg": self.ACCENT_P1_SOFT, "highlightthickness": 0, "bd": 0},
+             inactive_label,
+             {"bg": self.ACCENT_P2, "highlightbackground": self.ACCENT_P2, "highlightthickness": 2, "bd": 0},
+             active_label),
+        ]
+        # turn each look into one ready Tcl script ("<widget> configure -opt {value} ..." per widget),
+        # so a turn swap is a single interpreter call instead of four kwargs -> Tcl translations
+        widgets = (self.p1_wrap, self.player1_label, self.p2_wrap, self.player2_label)
+        self._hl_scripts = [
+            "\n".join(
+                f"{widget} configure " + " ".join(f"-{option} {{{value}}}" for option, value in cfg.items())
+                for widget, cfg in zip(widgets, state)
+            )
+            for state in hl_states
+        ]
+
+        # last values rendered in the score area, so repeated refreshes with the same state are skipped
+        self._last_highlighted = None
+        self._last_scores = (None, None)
+
+        # build the grid and highlight the first player on the first idle moment of the event loop
+        self.root.after_idle(self._build_deferred)
+
+    def _build_deferred(self):
+        """
+        Create the grid and highlight the starting player. Runs once, either from the event loop
+        or synchronously when the GameHandler touches the board before the window is shown
+        (e.g. a computer player making the first move).
+        """
+        if self._grid_ready:
+            return
+        self._grid_ready = True
         # create the grid using the matrix dimension from GameHandler
         self.create_grid(self.game_handler.dimMat)
-
         #Highlights the first player
         # highlight the player who starts (current_player is maintained by GameHandler)
         self.highlight_current_player(self.game_handler.current_player)
@@ -106,123 +198,193 @@ class Board:
         main_color = "#FFFFFF"  # white
         font = ("Helvetica", 28, "bold")
 
-        # draw an outline around the text by shifting in four directions
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            canvas.create_text(300 + dx, y + dy, text=text, fill=shadow_color, font=font)
+        # a single offset shadow instead of four outline copies: two canvas items to redraw instead of five
+        canvas.create_text(300 + 2, y + 2, text=text, fill=shadow_color, font=font)
         # draw the main text in the center on top of the shadow
         canvas.create_text(300, y, text=text, fill=main_color, font=font)
 
     #  Grid creation
     def create_grid(self, size):
         #  dynamic sizing so big boards still fit on screen
-        #adapt button size and font depending on matrix dimension
-        if size <= 5:
-            btn_w, btn_h, fsize, pad = 8, 3, 16, 3
-        elif size <= 8:
-            btn_w, btn_h, fsize, pad = 6, 2, 14, 2
-        else:  # for 9x9 or 10x10 boards
-            btn_w, btn_h, fsize, pad = 4, 2, 12, 1
-
-        # iterate over each cell in the matrix to create a corresponding button
+        #adapt cell size (in pixels) and font depending on matrix dimension (last tier covers anything bigger)
+        cell_w, cell_h, fsize, pad = next(
+            (tier for max_size, tier in SIZE_TIERS if size <= max_size), SIZE_TIERS[-1][1]
+        )
+
+        # distance between the top-left corners of two neighbouring cells (used to map clicks back to cells)
+        self.cell_step_x = cell_w + 2 * pad
+        self.cell_step_y = cell_h + 2 * pad
+
+        # the whole board is drawn on ONE canvas instead of one Tk button widget per cell
+        self.grid_canvas = tk.Canvas(
+            self.grid_frame,
+            width=size * self.cell_step_x,
+            height=size * self.cell_step_y,
+            bg=self.COLOR_BG,
+            highlightthickness=0
+        )
+        self.grid_canvas.pack()
+
+        # one font object shared by every cell text
+        self.font_cell = tkfont.Font(root=self.root, family="Helvetica", size=fsize, weight="bold")
+        # hoist loop invariants out of the N x N loop
+        # (one bulk conversion of the NumPy board instead of an ndarray item lookup per cell)
+        matrix = self.game_handler.values.tolist()
+        canvas = self.grid_canvas
+        font = self.font_cell
+        step_x, step_y = self.cell_step_x, self.cell_step_y
+        color_btn, color_text, color_disabled = self.COLOR_BTN, self.COLOR_TEXT, self.COLOR_DISABLED
+
+        # build ONE Tcl command that creates every cell (a rectangle with the value on top) and
+        # returns all item ids, instead of two Python -> Tcl round-trips per cell
+        creates = []
         for r in range(size):
-            row_buttons = []   # temporary list for all buttons in this row
+            matrix_row = matrix[r]
+            y0 = r * step_y + pad
             for c in range(size):
-                btn = tk.Button(
-                    self.grid_frame,
-                    text=f"{self.game_handler.matrix[r][c]}",  # display matrix value as text
-                    width=btn_w,
-                    height=btn_h,
-                    bg=self.COLOR_BTN,
-                    fg=self.COLOR_TEXT,
-                    activebackground=self.COLOR_BTN,
-                    activeforeground=self.COLOR_TEXT,
-                    relief="flat",
-                    bd=1,
-                    highlightthickness=0,
-                    font=("Helvetica", fsize, "bold"),
-                    # use lambda with default args to capture current row/col
-                    command=lambda row=r, col=c: self.cell_clicked(row, col)
+                x0 = c * step_x + pad
+                creates.append(
+                    f"[{canvas} create rectangle {x0} {y0} {x0 + cell_w} {y0 + cell_h}"
+                    f" -fill {color_btn} -outline {color_btn}]"
+                )
+                # the disabled look is defined once here, so toggling a cell only has to switch its state
+                creates.append(
+                    f"[{canvas} create text {x0 + cell_w // 2} {y0 + cell_h // 2} -text {{{matrix_row[c]}}}"
+                    f" -fill {color_text} -disabledfill {color_disabled} -font {font}]"
                 )
-                # place the button within the grid layout at row r, column c
-                btn.grid(row=r, column=c, padx=pad, pady=pad)
-                row_buttons.append(btn)
-            # after finishing the row, store its button list in grid_buttons
-            self.grid_buttons.append(row_buttons)
+        ids = self.root.tk.splitlist(self.root.tk.eval("list " + " ".join(creates)))
+
+        # store the canvas item ids of every cell, aligned with matrix coordinates;
+        # as arrays a whole row or column of items is a single slice (e.g. grid_texts[row, :])
+        ids = np.array(ids, dtype=np.int32).reshape(size, size, 2)
+        self.grid_rects = ids[:, :, 0]
+        self.grid_texts = ids[:, :, 1]
+
+        # pre-built Tcl commands that switch a cell to "normal"/"disabled", so a state change
+        # only has to look up a ready string instead of formatting the canvas path and item id again
+        self._state_cmds = {
+            state: [[f"{canvas} itemconfigure {text} -state {state}" for text in row] for row in self.grid_texts.tolist()]
+            for state in ("normal", "disabled")
+        }
+        # and the complete "taken" look of every cell (text "-", disabled, clicked color) as one ready script
+        clicked = self.COLOR_CLICKED
+        self._taken_cmds = [
+            [f"{canvas} itemconfigure {text} -text {{-}} -state disabled\n"
+             f"{canvas} itemconfigure {rect} -fill {clicked} -outline {clicked}"
+             for rect, text in zip(rect_row, text_row)]
+            for rect_row, text_row in zip(self.grid_rects.tolist(), self.grid_texts.tolist())
+        ]
+
+        # a single click binding for the whole board
+        self.grid_canvas.bind("<Button-1>", self._on_canvas_click)
+
+        # mask of the cells that are currently enabled (True = yes),
+        # so a click only has to reconfigure the cells whose state changes
+        self._enabled_mask = np.ones((size, size), dtype=bool)
+        # compile the legal mask helper now (no-op without numba) so the first click doesn't pay for it
+        _legal_mask(self.game_handler.taken, 0, 0)
+
+    def _on_canvas_click(self, event):
+        # translate the pixel position of the click into board coordinates
+        row = event.y // self.cell_step_y
+        col = event.x // self.cell_step_x
+        size = self.game_handler.dimMat
+        if not (0 <= row < size and 0 <= col < size):
+            return
+        # disabled cells ignore clicks, exactly like a disabled button would
+        if not self._enabled_mask[row, col]:
+            return
+        self.cell_clicked(row, col)
+
+    def _cell_cmds(self, changes):
+        """
+        Build the Tcl commands for a batch of cell reconfigurations and record the new states.
+        changes is a list of (row, col, state) tuples.
+        """
+        # local names for everything used inside the loop
+        state_cmds = self._state_cmds
+        enabled = self._enabled_mask
+        commands = []
+        append = commands.append
+        for r, c, state in changes:
+            # disabled cells switch to the greyed-out text color set up in create_grid
+            append(state_cmds[state][r][c])
+            enabled[r, c] = state == "normal"
+        return commands
+
+    def _apply_cell_changes(self, changes):
+        """
+        Send all pending cell reconfigurations to Tcl as one script instead of one call per item.
+        """
+        if not changes:
+            return
+        # a single interpreter entry for the whole batch
+        self.root.tk.eval("\n".join(self._cell_cmds(changes)))
+
+    def _score_cmds(self):
+        # commands refreshing the score labels, empty if they already show the current scores
+        s1, s2 = self.game_handler.score
+        if (s1, s2) == self._last_scores:
+            return []
+        self._last_scores = (s1, s2)
+        v1, v2 = self._name_vars
+        return [f'{self.player1_label} configure -text "${{{v1}}}: {s1}"',
+                f'{self.player2_label} configure -text "${{{v2}}}: {s2}"']
+
+    def _legality_cmds(self, row, col):
+        # only the row and the column of the last move can be enabled (minus the cells already chosen)
+        new_enabled = _legal_mask(self.game_handler.taken, row, col)
+        # touch only the cells whose state actually changes
+        changed = np.argwhere(new_enabled != self._enabled_mask).tolist()
+        return self._cell_cmds([(r, c, "normal" if new_enabled[r, c] else "disabled") for r, c in changed])
+
+    def apply_move(self, row, col):
+        """
+        Render a whole move with one Tcl script: the chosen cell is shown as taken, only the cells
+        in its row and column stay enabled for the next player, and the scores and highlight are refreshed.
+        """
+        self._build_deferred()
+        # the taken cell: one pre-built script, no formatting per click
+        commands = [self._taken_cmds[row][col]]
+        self._enabled_mask[row, col] = False
+        commands += self._legality_cmds(row, col)
+
+        commands += self._score_cmds()
+        current = self.game_handler.current_player
+        if current != self._last_highlighted:
+            self._last_highlighted = current
+            commands.append(self._hl_scripts[current])
+
+        self.root.tk.eval("\n".join(commands))
 
     # When it is clicked
     def cell_clicked(self, row, col):
         #Notify the GameHandler first (it will update game state and swap turns)
         # this ensures the logic (scores, matrix, next player) is updated centrally
+        # (the handler renders the move, scores and next player through apply_move)
         self.game_handler.handle_cell_click(row, col)
 
-        # Then refresh UI to reflect the new current player and scores
-        # schedule GUI updates right after event handling to keep interface responsive
-        self.root.after(0, lambda: self.highlight_current_player(self.game_handler.current_player))
-        self.root.after(0, self.update_scores)
-
-    #Score update
-    def update_scores(self):
-        # retrieve current scores from GameHandler
-        s1, s2 = self.game_handler.score
-        # update labels for both players with fresh scores
-        self.player1_label.config(text=f"{self.game_handler.players[0].getName()}: {s1}")
-        self.player2_label.config(text=f"{self.game_handler.players[1].getName()}: {s2}")
-
     # Highlight the current player
     def highlight_current_player(self, current: int):
         """
         Visually highlight the active player using the strong accent color and bold label,
         and render the inactive player with the soft accent.
         """
-        def _apply(active_wrap, active_label, active_color,
-                   inactive_wrap, inactive_label, inactive_soft):
-            # Active: strong accent + subtle outline; label "lifts" on COLOR_BTN and is bold
-            active_wrap.config(bg=active_color, highlightbackground=active_color, highlightthickness=2, bd=0)
-            active_label.config(bg=self.COLOR_BTN, fg=self.COLOR_TEXT, font=("Helvetica", 14, "bold"))
-
-            # Inactive: soft accent; label returns to background and normal weight
-            inactive_wrap.config(bg=inactive_soft, highlightthickness=0, bd=0)
-            inactive_label.config(bg=self.COLOR_BG, fg=self.COLOR_TEXT, font=("Helvetica", 14, "normal"))
-
-        # if current == 0 then Player 1 is active
-        if current == 0:
-            _apply(self.p1_wrap, self.player1_label, self.ACCENT_P1,
-                   self.p2_wrap, self.player2_label, self.ACCENT_P2_SOFT)
-        # else Player 2 is active
-        else:
-            _apply(self.p2_wrap, self.player2_label, self.ACCENT_P2,
-                   self.p1_wrap, self.player1_label, self.ACCENT_P1_SOFT)
+        # nothing to do if this player is already highlighted
+        if current == self._last_highlighted:
+            return
+        self._last_highlighted = current
+
+        # Active: strong accent + subtle outline; label "lifts" on COLOR_BTN and is bold
+        # Inactive: soft accent; label returns to background and normal weight
+        self.root.tk.eval(self._hl_scripts[current])
 
     #Starting the window
     def set_visible(self):
         # start the Tkinter main event loop and display the window
         self.root.mainloop()
 
-    def update_active_buttons(self, active_row, active_col):
-        """
-        Turns off all buttons except for those in the same row or column
-        of the clicked cell (if not disabled or marked.)
-        """
-        # loop over every cell in the board to update its state
-        for r in range(self.game_handler.dimMat):
-            for c in range(self.game_handler.dimMat):
-                button = self.grid_buttons[r][c]
-
-                #if the cell is already clicked, keep it disabled
-                # (matrix stores '-' for cells that have been chosen)
-                if self.game_handler.matrix[r][c] == "-":
-                    button.config(state="disabled", bg=self.COLOR_CLICKED)
-
-                # if it's in the same row or column, keep it active
-                elif r == active_row or c == active_col:
-                    button.config(state="normal")
-                #otherwise, disable it
-                else:
-                    button.config(state="disabled")
-
     def disable_all_buttons(self):
-        # helper method to make the entire grid non-interactive (e.g., at game end)
-        for r in range(self.game_handler.dimMat):
-            for c in range(self.game_handler.dimMat):
-                button = self.grid_buttons[r][c]
-                button.config(state="disabled")
+        # helper method to make the entire board non-interactive (e.g., at game end)
+        self._build_deferred()
+        self._apply_cell_changes([(r, c, "disabled") for r, c in np.argwhere(self._enabled_mask).tolist()])
@@ -1,7 +1,17 @@
+import os
+import array
+import random
+import multiprocessing
 import tkinter as tk
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import numpy as np
 from Game import Board, fileReading
 
+# how often the Tk thread checks whether a computer move is ready
+MOVE_POLL_MS = 20
+
 
 class GameHandler:
     """ The GameHandler class is the central control unit for the "RC GAME," a two-player,
@@ -10,27 +20,72 @@ class GameHandler:
         by the `Board` class.
 
         Responsibilities include:
-        1. Initializing the game board (matrix) by reading data from a file.
+        1. Initializing the game board (matrix) from the setup or by reading data from a file.
         2. Tracking and updating the scores for the two players (human or computer).
         3. Handling both human clicks and computer moves.
         4. Switching turns and enabling/disabling the correct buttons based on the last move
             (limiting moves to the same row or column).
         5. Detecting the end of the game and announcing the winner.
+
+        With `headless=True` (computer players only) no window is created at all: `play()` / `run_headless()`
+        run the whole game in pure Python/NumPy and return the final scores, e.g. for benchmarking.
+        `tick_ms` is the pause before each computer move in the GUI (default: 1000 ms if a human plays, else 0).
         """
 
-    def __init__(self, player1, player2, root=None):
-        self.root = root if root is not None else tk.Tk()
+    def __init__(self, player1, player2, root=None, matrix=None, headless=False, tick_ms=None):
+        self.headless = headless
         self.players = [player1, player2] # 0 = P1, 1 = P2
+        if headless and any(p.is_human for p in self.players):
+            raise ValueError("A headless game can only be played by computer players.")
+        self.root = None if headless else (root if root is not None else tk.Tk())
         self.current_player = 0 # 0 = P1, 1 = P2
-        self.score = [0, 0]
-        self.matrix = fileReading.load_board_until_ok()
-        self.dimMat = len(self.matrix)
+        # by default pause before a computer move only when someone is watching; computer-only games run at full speed
+        self._has_human = any(p.is_human for p in self.players)
+        self.tick_ms = tick_ms if tick_ms is not None else (1000 if self._has_human else 0)
+        # scores as two machine ints (signed 64 bit) instead of boxed Python ints in a list
+        self.score = array.array('q', [0, 0])
+        # use the board handed over by the setup if there is one, otherwise read it from file
+        raw = matrix if matrix is not None else fileReading.load_board_until_ok()
+        # contiguous value grid plus a mask of taken cells instead of overwriting values with '-';
+        # C order is guaranteed even for a sliced/transposed matrix, so a row is one contiguous block
+        self.values = np.ascontiguousarray(raw, dtype=np.int8)
+        self.dimMat = len(self.values)
+        self.taken = np.zeros((self.dimMat, self.dimMat), dtype=bool)
+        # free cells per row (column indices) and per column (row indices), updated per move instead of rescanned
+        self.row_free = [list(range(self.dimMat)) for _ in range(self.dimMat)]
+        self.col_free = [list(range(self.dimMat)) for _ in range(self.dimMat)]
+        self.remaining = self.dimMat * self.dimMat   # cells not taken yet
         self.last_move = None
+        # computer moves are computed off the Tk thread so the window stays responsive while a strategy thinks;
+        # a headless game has no Tk thread to keep free and computes its moves in the calling thread
+        self._pool = None if headless else ThreadPoolExecutor(max_workers=1)
+        # MCTS players search in parallel: one independent search per core, visit counts merged (root parallelization)
+        self._mcts_workers = os.cpu_count() or 1
+        self._mcts_pool = None
+        # imported only when a game is created, so the setup window does not load the MCTS module
+        from Strategies.MCTS import MCTSStrategy
+        self._mcts_players = [p for p in self.players if isinstance(p.strategy, MCTSStrategy)]
+        if self._mcts_players:
+            self._mcts_pool = multiprocessing.get_context("spawn").Pool(self._mcts_workers)
 
         # create Board and link this handler
-        self.board = Board.Board(self)
+        self.board = None if headless else Board.Board(self)
+
+    @property
+    def matrix(self):
+        """
+        The board as the strategies see it: a read-only int8 array of the cell values with 0 on taken cells.
+        Built on demand from `values` and `taken`, so it never goes out of sync, and it is a fresh snapshot
+        the worker thread/processes can read while the game goes on.
+        """
+        board = np.where(self.taken, 0, self.values).astype(np.int8, copy=False)
+        board.setflags(write=False)
+        return board
 
     def play(self):
+        if self.headless:
+            return self.run_headless()
+
         # If P1 is a computer, let it start
         if not self.players[0].is_human:
             self.computer_turn()
@@ -41,18 +96,19 @@ class GameHandler:
     #helpers for ending the game
     def has_any_legal_moves(self) -> bool:
         """
-        Returns True if at least one button is currently clickable (state='normal').
-        Assumes Board.update_active_buttons(...) has set button states correctly.
+        Returns True if at least one cell is currently a legal move.
+        O(1) from the free-cell counters: the next move must lie in the row or column of the last one.
         """
-        for row_btns in self.board.grid_buttons:
-            for btn in row_btns:
-                if str(btn['state']) == 'normal':
-                    return True
-        return False
+        if self.last_move is None:
+            return self.remaining > 0
+        r, c = self.last_move
+        # the last cell itself is already taken, so the row and column lists never share a cell
+        return bool(self.row_free[r] or self.col_free[c])
 
     def end_game_and_announce(self):
         """Disable the board and pop up a winner dialog with player names."""
         self.board.disable_all_buttons()
+        self._close_pools()
 
         # Use chosen names instead of generic "Player 1/2"
         name1 = self.players[0].getName()
@@ -74,10 +130,71 @@ class GameHandler:
         messagebox.showinfo("Game Over", message)
 
 
+    def run_headless(self):
+        """Play the whole game in the calling thread without any Tk interaction; returns the final scores."""
+        if not self.headless:
+            raise ValueError("run_headless needs a game created with headless=True.")
+        while True:
+            move_result = self._move_task(self.players[self.current_player])()
+            if move_result is None:
+                break
+            row, col = move_result
+            self.handle_cell_click(row, col)
+            if not self.has_any_legal_moves():
+                break
+        self._close_pools()
+        return tuple(self.score)
+
+    def _close_pools(self):
+        """Shut down the move thread and the MCTS worker processes once the game is over."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        if self._mcts_pool is not None:
+            # no search is running any more: close() lets the workers exit, join() waits until they have
+            self._mcts_pool.close()
+            self._mcts_pool.join()
+
+    def _move_task(self, player):
+        """The call computing the next move of a computer player, bound to a snapshot of the game state."""
+        if self._mcts_pool is not None and player in self._mcts_players:
+            return partial(self._mcts_parallel_move, player.strategy, self.matrix, self.last_move, list(self.score))
+        return partial(player.move, self.matrix, self.last_move, list(self.score))
+
     # Computer turn
     def computer_turn(self):
         player = self.players[self.current_player]
-        move_result = player.move(self.matrix, self.last_move, self.score)
+        # the worker only gets snapshots of the game state, never the widgets
+        future = self._pool.submit(self._move_task(player))
+        self._poll_move(future)
+
+    def _poll_move(self, future):
+        """
+        Check on the Tk thread whether the worker is done; Tk must not be called from the worker thread itself.
+        result() is read here as well, so strategy errors surface normally.
+        """
+        if future.done():
+            self._apply_move(future)
+        else:
+            self.root.after(MOVE_POLL_MS, self._poll_move, future)
+
+    def _mcts_parallel_move(self, strategy, matrix, last_move, scores):
+        """
+        Run one MCTS search per worker process on the same position (each with its own seed)
+        and pick the move with the most visits over all searches.
+        """
+        from Strategies.MCTS import run_rollouts   # loaded already: this player is an MCTS player
+        seed = random.getrandbits(32)
+        jobs = [(matrix, last_move, scores, strategy.time_limit, seed + i) for i in range(self._mcts_workers)]
+        merged = {}
+        for visits in self._mcts_pool.map(run_rollouts, jobs):
+            for move, count in visits.items():
+                merged[move] = merged.get(move, 0) + count
+        if not merged:
+            return None
+        return max(merged, key=merged.get)
+
+    def _apply_move(self, future):
+        move_result = future.result()
         if move_result is None:
             # No legal moves for this player means game over
             self.end_game_and_announce()
@@ -87,36 +204,44 @@ class GameHandler:
 
     #Handle a click from the board (human or AI)
     def handle_cell_click(self, row, col):
-        print(f"[DEBUG] Player {self.current_player+1} clicked ({row}, {col})")
+        # local names for the attributes used more than once below
+        board = self.board
+        cp = self.current_player
+        print(f"[DEBUG] Player {cp+1} clicked ({row}, {col})")
 
         # update score for the current player
-        self.score[self.current_player] += self.matrix[row][col]
-        self.board.update_scores()
-
-        # update matrix (mark cell as taken)
-        self.matrix[row][col] = "-"
+        self.score[cp] += int(self.values[row, col])
 
-        #update the button on the board
-        button = self.board.grid_buttons[row][col]
-        button.config(text="-", state="disabled", bg=self.board.COLOR_CLICKED)
+        # mark cell as taken
+        self.taken[row, col] = True
+        self.row_free[row].remove(col)
+        self.col_free[col].remove(row)
+        self.remaining -= 1
 
         self.last_move = (row, col)
 
         # Switch player
-        self.current_player = 1 if self.current_player == 0 else 0
-        self.board.highlight_current_player(self.current_player)
+        cp = 1 if cp == 0 else 0
+        self.current_player = cp
+
+        if board is None:
+            # headless: nothing to render, run_headless checks for the end of the game itself
+            return
 
-        #enable legal buttons for the NEXT player based on the last move
-        self.board.update_active_buttons(row, col)
+        # update the board in one batch: taken cell, legal cells for the NEXT player, scores and highlight
+        board.apply_move(row, col)
 
         # If the next player has no legal moves, end now
         if not self.has_any_legal_moves():
-            # Small delay so UI shows the last click before the dialog
-            self.root.after(100, self.end_game_and_announce)
+            if self._has_human:
+                # Small delay so UI shows the last click before the dialog
+                self.root.after(100, self.end_game_and_announce)
+            else:
+                self.end_game_and_announce()
             return
 
         # If the next player is a computer, schedule its move
-        if not self.players[self.current_player].is_human:
-            self.board.disable_all_buttons()
-            self.root.after(1000, self.computer_turn)
+        if not self.players[cp].is_human:
+            board.disable_all_buttons()
+            self.root.after(self.tick_ms, self.computer_turn)
 
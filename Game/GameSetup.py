@@ -1,17 +1,65 @@
 import tkinter as tk
 import os
 import random
+from functools import partial
+import importlib
+import numpy as np
 
 from Game import Player
 
-from Strategies.RandomStrategy import RandomStrategy
-from Strategies.safe_choice_strategy import SafeChoiceStrategy
-from Strategies.GreedyStrategy import GreedyStrategy
-from Strategies.MCTS import MCTSStrategy
-from Strategies.minimax_f import AlphaBetaStrategy
-
 CONSTANT_SEED = 12345
 
+# text of the instructions page
+INSTRUCTIONS_TEXT = (
+    "Welcome to the Row-Column Game!\n\n"
+    "Get ready to test your logic, prediction, and a bit of luck! The goal is simple: collect "
+    "the highest score while moving through a grid of numbers, but the twist is that each move "
+    "changes what you can play next.\n\n"
+    "Rules:\n"
+    "The game board is a square grid filled with numbers from 1 to 9. Two players take turns clicking one of "
+    "the cells to claim it, and the value in that cell is added to their score. Once a cell has "
+    "been clicked, it becomes unavailable. The crucial twist lies in the movement rule: On your "
+    "next turn, you can only choose a cell that is in the same row or the same column as the cell "
+    "your opponent just chose. The game continues until there are no valid moves left. Once the "
+    "game has ended, the player with the highest total score is the winner.\n\n"
+    "Instructions:\n"
+    "Before starting the game, you'll need to configure the following settings:\n\n"
+    "1. Player Names: Enter the names for Player 1 and Player 2.\n"
+    "2. Player Type: For each player, select whether they are a Human or a Computer.\n"
+    "3. Computer Strategy: If a player is set to Computer, choose their AI strategy from: Random, "
+    "Greedy, Safe Choice, Monte Carlo Tree Search or Minimax.\n"
+    "4. Board Size: Select the size of the grid.\n"
+    "5. Reproducibility (Optional): Turning on Reproducibility means the numbers in the game board "
+    "will be generated using a fixed random seed. If you enable it and keep the same board size across "
+    "multiple games, you'll get the same layout every time, making it perfect for practicing strategies! "
+    "If left off, a completely random board will be created for each new game.\n\n"
+    "You’re all set to begin your match! Best of luck, and most importantly, have fun!"
+)
+
+# character offsets of the highlighted headings in INSTRUCTIONS_TEXT (the text never changes,
+# so they are found once here instead of searching the Text widget on every build)
+INSTRUCTIONS_HEADINGS = {
+    "rules": INSTRUCTIONS_TEXT.find("Rules:"),
+    "instructions": INSTRUCTIONS_TEXT.find("Instructions:"),
+    "ending": INSTRUCTIONS_TEXT.find("Best of luck"),
+}
+
+# single source of truth for the strategies offered in the setup: name -> (radiobutton label, module, class).
+# A strategy module is only imported once that strategy is actually chosen, so the setup window does not
+# wait for the heavy ones
+STRATEGY_REGISTRY = {
+    "random": ("Random Strategy", "Strategies.RandomStrategy", "RandomStrategy"),
+    "safe_choice": ("Safe Choice Strategy", "Strategies.safe_choice_strategy", "SafeChoiceStrategy"),
+    "greedy": ("Greedy Strategy", "Strategies.GreedyStrategy", "GreedyStrategy"),
+    "MCTS": ("Monte Carlo Tree Search Strategy", "Strategies.MCTS", "MCTSStrategy"),
+    "minimax": ("Minimax", "Strategies.minimax_f", "AlphaBetaStrategy"),
+}
+
+# strategies that keep no state between moves: one instance is created on first use and then shared.
+# Random is not among them: every RandomStrategy owns its random generator, so each player gets its own
+SHARED_STRATEGIES = {"safe_choice", "greedy"}
+_shared_instances = {}
+
 class GameSetup:
     """
         GUI setup wizard for RC GAME.
@@ -20,11 +68,8 @@ class GameSetup:
     def __init__(self):
         self.root = tk.Tk()  # own set-up window
         self.root.title("Game Start")
-        #Open fullscreen on any OS
-        try:
-            self.root.state("zoomed")  # windows
-        except Exception:
-            self.root.attributes("-fullscreen", True)  # macOS/Linux fallback
+        # build the first page at a fixed size; going fullscreen is deferred until it is packed (see _maximize)
+        self.root.geometry("1024x720")
 
         # palette
         self.COLOR_BG = "#F8C8DC" # for background
@@ -37,17 +82,16 @@ class GameSetup:
         # apply window background
         self.root.config(bg=self.COLOR_BG)
 
-        # Hold optional strategy selections for p1/p2 (string names)
-        self.p1_strategy_var = tk.StringVar(value="")  # empty means not selected yet
-        self.p2_strategy_var = tk.StringVar(value="")
-
-        # Variables for board size, reproducibility and board file
-        self.board_size_var = tk.StringVar(value="5")
-        self.reproducible_var = tk.BooleanVar(value=False)
+        # the setup variables (strategies, board size, reproducibility) are created with the setup page
         self.repro_checkbox = None
         self.board_file = None
+        self.generated_matrix = None  # last generated board, kept in memory
         self.btn_manual = None
 
+        # page frames of the wizard, built on first visit (see _show_page)
+        self._pages = {}
+        self._current_page = None
+
         # Frames that will host strategy buttons (created later)
         self.p1_strategy_frame = None
         self.p2_strategy_frame = None
@@ -55,42 +99,94 @@ class GameSetup:
         self.show_start_page()
         self.p1 = None
         self.p2 = None
+        # one resize to fullscreen once all start page widgets exist, instead of relayouts while building them
+        self.root.after(0, self._maximize)
+
+    def _maximize(self):
+        #Open fullscreen on any OS
+        try:
+            self.root.state("zoomed")  # windows
+        except Exception:
+            self.root.attributes("-fullscreen", True)  # macOS/Linux fallback
 
     def _draw_outlined_title(self, parent, text, height=60, y=30):
         # create a canvas that stretches with the window
         canvas = tk.Canvas(parent, height=height, bg=self.COLOR_BG, highlightthickness=0)
         canvas.pack(fill="x", pady=(8, 6))
 
+        pending = None   # id of the scheduled redraw, if any
+        last_width = None   # width the title was last drawn for
+        items = None   # ids of the 4 shadow texts and the main text, created on the first draw
+        offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]   # shadow offsets around the main text
+
         def draw():
-            canvas.delete("all")
+            nonlocal pending, last_width, items
+            pending = None
+            # the page may have been switched (canvas destroyed) before a scheduled redraw runs
+            if not canvas.winfo_exists():
+                return
             width = canvas.winfo_width() or parent.winfo_width() or 420
+            # height-only or repeated Configure events don't move the centered text
+            if width == last_width:
+                return
+            last_width = width
+            cx = width // 2
+            if items is not None:
+                # later draws only move the existing texts to the new center
+                for item, (dx, dy) in zip(items, offsets):
+                    canvas.coords(item, cx + dx, y + dy)
+                canvas.coords(items[4], cx, y)
+                return
             shadow_color = "#C75A9B"
             main_color = "#FFFFFF"
             font = ("Helvetica", 22, "bold")
-            cx = width // 2
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                canvas.create_text(cx + dx, y + dy, text=text, fill=shadow_color, font=font)
-            canvas.create_text(cx, y, text=text, fill=main_color, font=font)
+            items = [canvas.create_text(cx + dx, y + dy, text=text, fill=shadow_color, font=font)
+                     for dx, dy in offsets]
+            items.append(canvas.create_text(cx, y, text=text, fill=main_color, font=font))
+
+        def schedule(_event):
+            # debounce: a resize fires many Configure events, only redraw once it settles
+            nonlocal pending
+            if pending is not None:
+                canvas.after_cancel(pending)
+            pending = canvas.after(60, draw)
 
         # draw now and whenever the window resizes
-        canvas.bind("<Configure>", lambda e: draw())
+        canvas.bind("<Configure>", schedule)
         parent.after(0, draw)
         return canvas
     
     def run(self):
         self.root.mainloop()
-        return [self.p1, self.p2]
+        # the generated board travels in memory, so the game doesn't have to read it back from disk
+        return [self.p1, self.p2, self.generated_matrix]
+
+    def _show_page(self, name, build):
+        """
+        Show one page of the wizard. Each page is built into its own frame on its first visit only;
+        switching pages just hides the current frame and packs the requested one.
+        """
+        self.clear_window()
+        page = self._pages.get(name)
+        if page is None:
+            page = tk.Frame(self.root, bg=self.COLOR_BG)
+            build(page)
+            self._pages[name] = page
+        page.pack(fill="both", expand=True)
+        self._current_page = name
 
     # start page
     def show_start_page(self):
-        self.clear_window()
+        self._show_page("start", self._build_start_page)
+
+    def _build_start_page(self, page):
 
         # Title (canvas with outlined text)
-        self._draw_outlined_title(self.root, "Welcome to the Row-Column Game!")
+        self._draw_outlined_title(page, "Welcome to the Row-Column Game!")
 
         # START button
         # center a frame vertically and horizontally for buttons
-        button_frame = tk.Frame(self.root, bg=self.COLOR_BG)
+        button_frame = tk.Frame(page, bg=self.COLOR_BG)
         button_frame.pack(expand=True)
 
         tk.Button(
@@ -116,13 +212,15 @@ class GameSetup:
 
     # switches to instruction page
     def show_instructions(self):
-        self.clear_window()
+        self._show_page("instructions", self._build_instructions)
+
+    def _build_instructions(self, page):
         # Responsive title
-        self._draw_outlined_title(self.root, "Row-Column Game Instructions")
+        self._draw_outlined_title(page, "Row-Column Game Instructions")
 
         # Centered "card"
         card = tk.LabelFrame(
-            self.root, bg=self.COLOR_BG, fg=self.COLOR_TEXT,
+            page, bg=self.COLOR_BG, fg=self.COLOR_TEXT,
             text="", highlightthickness=2, labelanchor="n"
         )
         card.configure(highlightbackground=self.ACCENT_SOFT, highlightcolor=self.ACCENT_SOFT, highlightthickness=2)
@@ -134,31 +232,6 @@ class GameSetup:
 
         # Scrollable text
         import tkinter.scrolledtext as st
-        instructions_text = (
-            "Welcome to the Row-Column Game!\n\n"
-            "Get ready to test your logic, prediction, and a bit of luck! The goal is simple: collect "
-            "the highest score while moving through a grid of numbers, but the twist is that each move "
-            "changes what you can play next.\n\n"
-            "Rules:\n"
-            "The game board is a square grid filled with numbers from 1 to 9. Two players take turns clicking one of "
-            "the cells to claim it, and the value in that cell is added to their score. Once a cell has "
-            "been clicked, it becomes unavailable. The crucial twist lies in the movement rule: On your "
-            "next turn, you can only choose a cell that is in the same row or the same column as the cell "
-            "your opponent just chose. The game continues until there are no valid moves left. Once the "
-            "game has ended, the player with the highest total score is the winner.\n\n"
-            "Instructions:\n"
-            "Before starting the game, you'll need to configure the following settings:\n\n"
-            "1. Player Names: Enter the names for Player 1 and Player 2.\n"
-            "2. Player Type: For each player, select whether they are a Human or a Computer.\n"
-            "3. Computer Strategy: If a player is set to Computer, choose their AI strategy from: Random, "
-            "Greedy, Safe Choice, Monte Carlo Tree Search or Minimax.\n"
-            "4. Board Size: Select the size of the grid.\n"
-            "5. Reproducibility (Optional): Turning on Reproducibility means the numbers in the game board "
-            "will be generated using a fixed random seed. If you enable it and keep the same board size across "
-            "multiple games, you'll get the same layout every time, making it perfect for practicing strategies! "
-            "If left off, a completely random board will be created for each new game.\n\n"
-            "You’re all set to begin your match! Best of luck, and most importantly, have fun!"
-        )
 
         txt = st.ScrolledText(
             body, wrap="word", height=18,
@@ -167,7 +240,7 @@ class GameSetup:
         )
         txt.pack(fill="both", expand=True)
 
-        txt.insert("1.0", instructions_text)
+        txt.insert("1.0", INSTRUCTIONS_TEXT)
 
         # Formatting tags
         bright_pink = "#E36BAE"
@@ -176,27 +249,22 @@ class GameSetup:
         txt.tag_config("welcome", foreground=bright_pink, font=("Helvetica", 18, "bold"))
 
         #fine-tuning to make instructions clearer
-        rules_index = txt.search("Rules:", "1.0", tk.END)
-        if rules_index:
-            txt.tag_add("rules", rules_index, f"{rules_index} lineend")
-            txt.tag_config("rules", foreground=bright_pink, font=("Helvetica", 16, "bold"))
-
-        instructions_index = txt.search("Instructions:", "1.0", tk.END)
-        if instructions_index:
-            txt.tag_add("instructions", instructions_index, f"{instructions_index} lineend")
-            txt.tag_config("instructions", foreground=bright_pink, font=("Helvetica", 16, "bold"))
-
-
-        end_index = txt.search("Best of luck", "1.0", tk.END)
-        if end_index:
-            txt.tag_add("ending", end_index, f"{end_index} lineend")
-            txt.tag_config("ending", foreground=bright_pink, font=("Helvetica", 14, "bold"))
+        heading_fonts = {
+            "rules": ("Helvetica", 16, "bold"),
+            "instructions": ("Helvetica", 16, "bold"),
+            "ending": ("Helvetica", 14, "bold"),
+        }
+        for tag, offset in INSTRUCTIONS_HEADINGS.items():
+            if offset >= 0:
+                index = f"1.0 + {offset} chars"
+                txt.tag_add(tag, index, f"{index} lineend")
+                txt.tag_config(tag, foreground=bright_pink, font=heading_fonts[tag])
 
         txt.config(state="disabled")  # read-only
 
         # Footer
         tk.Button(
-            self.root, text="Go back to start page",
+            page, text="Go back to start page",
             command=self.show_start_page,
             bg=self.COLOR_BTN, fg=self.COLOR_TEXT,
             activebackground=self.COLOR_BTN, activeforeground=self.COLOR_TEXT,
@@ -206,13 +274,27 @@ class GameSetup:
 
     #switches to setup page
     def show_setup_page(self):
-        self.clear_window()
+        self._show_page("setup", self._build_setup_page)
+
+    def _build_setup_page(self, page):
+        # the setup variables are created with the page (first visit only), so choices survive going back and forth
+        # Hold optional strategy selections for p1/p2 (string names)
+        self.p1_strategy_var = tk.StringVar(value="")  # empty means not selected yet
+        self.p2_strategy_var = tk.StringVar(value="")
+
+        # Variables for board size and reproducibility
+        self.board_size_var = tk.StringVar(value="5")
+        self.reproducible_var = tk.BooleanVar(value=False)
+
+        # Re-check whenever strategy selection changes
+        self.p1_strategy_var.trace_add("write", lambda *_: self.update_start_button())
+        self.p2_strategy_var.trace_add("write", lambda *_: self.update_start_button())
 
         # Title (canvas)
-        self._draw_outlined_title(self.root, "Row-Column Game Setup")
+        self._draw_outlined_title(page, "Row-Column Game Setup")
 
         # Container (Player 1 vs. Player 2)
-        container = tk.Frame(self.root, bg=self.COLOR_BG)
+        container = tk.Frame(page, bg=self.COLOR_BG)
         container.pack(fill="x", padx=20, pady=(0, 8))  # <- no expand=True
         container.grid_columnconfigure(0, weight=1, minsize=180)
         container.grid_columnconfigure(1, weight=0, minsize=60)
@@ -247,7 +329,7 @@ class GameSetup:
         # Player 1 choice buttons
         self.p1_human = tk.Button(
             container, text="Human", width=12,
-            command=lambda: self.select_player("p1", "human"),
+            command=partial(self.select_player, "p1", "human"),
             bg=self.COLOR_BTN, fg=self.COLOR_TEXT,
             activebackground=self.COLOR_BTN, activeforeground=self.COLOR_TEXT,
             relief="flat", bd=1, highlightthickness=0
@@ -256,7 +338,7 @@ class GameSetup:
 
         self.p1_computer = tk.Button(
             container, text="Computer", width=12,
-            command=lambda: self.select_player("p1", "computer"),
+            command=partial(self.select_player, "p1", "computer"),
             bg=self.COLOR_BTN, fg=self.COLOR_TEXT,
             activebackground=self.COLOR_BTN, activeforeground=self.COLOR_TEXT,
             relief="flat", bd=1, highlightthickness=0
@@ -266,11 +348,13 @@ class GameSetup:
         # Placeholder for P1 strategies
         self.p1_strategy_frame = tk.Frame(container, bg=self.COLOR_BG)
         self.p1_strategy_frame.grid(row=3, column=0, pady=(0, 10))
+        self.show_strategy_options("p1")
+        self.p1_strategy_frame.grid_remove()  # hidden until Computer is chosen; grid() restores the position
 
         # Player 2 choice buttons
         self.p2_human = tk.Button(
             container, text="Human", width=12,
-            command=lambda: self.select_player("p2", "human"),
+            command=partial(self.select_player, "p2", "human"),
             bg=self.COLOR_BTN, fg=self.COLOR_TEXT,
             activebackground=self.COLOR_BTN, activeforeground=self.COLOR_TEXT,
             relief="flat", bd=1, highlightthickness=0
@@ -279,7 +363,7 @@ class GameSetup:
 
         self.p2_computer = tk.Button(
             container, text="Computer", width=12,
-            command=lambda: self.select_player("p2", "computer"),
+            command=partial(self.select_player, "p2", "computer"),
             bg=self.COLOR_BTN, fg=self.COLOR_TEXT,
             activebackground=self.COLOR_BTN, activeforeground=self.COLOR_TEXT,
             relief="flat", bd=1, highlightthickness=0
@@ -289,10 +373,12 @@ class GameSetup:
         # Placeholder for P2 strategies
         self.p2_strategy_frame = tk.Frame(container, bg=self.COLOR_BG)
         self.p2_strategy_frame.grid(row=3, column=2, pady=(0, 10))
+        self.show_strategy_options("p2")
+        self.p2_strategy_frame.grid_remove()  # hidden until Computer is chosen; grid() restores the position
 
         #Board Setup
         board_frame = tk.LabelFrame(
-            self.root, text="Board Setup", fg=self.COLOR_TEXT, bg=self.COLOR_BG,
+            page, text="Board Setup", fg=self.COLOR_TEXT, bg=self.COLOR_BG,
             font=("Arial", 13, "bold"), labelanchor="n"
         )
         board_frame.configure(highlightbackground=self.ACCENT_SOFT, highlightcolor=self.ACCENT_SOFT,
@@ -329,14 +415,14 @@ class GameSetup:
 
         tk.Button(
             btns, text="Create board with chosen size",
-            command=lambda: self.generate_board(),
+            command=self.generate_board,
             bg=self.COLOR_BTN, fg=self.COLOR_TEXT,
             activebackground=self.COLOR_BTN, activeforeground=self.COLOR_TEXT,
             relief="flat", bd=1, highlightthickness=0
         ).grid(row=0, column=0, sticky="w", padx=6)
 
         # footer buttons
-        footer = tk.Frame(self.root, bg=self.COLOR_BG)
+        footer = tk.Frame(page, bg=self.COLOR_BG)
         footer.pack(pady=(6, 12))
 
         tk.Button(
@@ -355,45 +441,30 @@ class GameSetup:
             width=20, height=2, font=("Helvetica", 11, "bold")
         )
         self.start_button.pack(side="left", padx=10)
+        self._start_state = "disabled"  # state last applied to start_button
 
-        # Re-check whenever strategy selection changes
-        self.p1_strategy_var.trace_add("write", lambda *_: self.update_start_button())
-        self.p2_strategy_var.trace_add("write", lambda *_: self.update_start_button())
-
-    # Creates strategy radio buttons dynamically when Computer is chosen
+    # Creates the strategy radio buttons once, when the setup page is built; select_player only shows/hides them
     def show_strategy_options(self, which_player: str):
         """
-        Create or refresh strategy radio buttons for the given player (1 or 2)
+        Create the strategy radio buttons for the given player (1 or 2)
         The chosen value is stored into p1_strategy_var / p2_strategy_var.
         """
         frame = self.p1_strategy_frame if which_player == "p1" else self.p2_strategy_frame
         var = self.p1_strategy_var if which_player == "p1" else self.p2_strategy_var
 
-        # Clear the frame before adding fresh widgets
-        for w in frame.winfo_children():
-            w.destroy()
-
         # Label
         tk.Label(
             frame, text="Select strategy:", fg=self.COLOR_TEXT, bg=self.COLOR_BG, font=("Arial", 10, "bold")
         ).pack(pady=(2, 2))
 
-        # RadioButtons
-        rb_values = [
-            ("Random Strategy", "random"),
-            ("Safe Choice Strategy", "safe_choice"),
-            ("Greedy Strategy", "greedy"),
-            ("Monte Carlo Tree Search Strategy", "MCTS"),  
-            ("Minimax", "minimax"),
-        ]
-        for text, value in rb_values:
+        # RadioButtons, one per registered strategy
+        for value, (text, _, _) in STRATEGY_REGISTRY.items():
             tk.Radiobutton(
                 frame, text=text, variable=var, value=value,
                 bg=self.COLOR_BG, fg=self.COLOR_TEXT,
                 selectcolor=self.COLOR_BTN,
-                activebackground=self.COLOR_BG, activeforeground=self.COLOR_TEXT,
-                command=self.update_start_button
-            ).pack(anchor="w")
+                activebackground=self.COLOR_BG, activeforeground=self.COLOR_TEXT
+            ).pack(anchor="w")  # the trace on var re-checks the start button
 
     # DOES NOT store player objects. Disables the opposite button and shows/hides strategy options.
     def select_player(self, player, choice):
@@ -403,23 +474,21 @@ class GameSetup:
                 self.p1_computer.config(state="disabled")
                 self.p1_human.config(relief="sunken")
                 self.p1_strategy_var.set("")
-                for w in self.p1_strategy_frame.winfo_children():
-                    w.destroy()
+                self.p1_strategy_frame.grid_remove()
             else:
                 self.p1_human.config(state="disabled")
                 self.p1_computer.config(relief="sunken")
-                self.show_strategy_options("p1")
+                self.p1_strategy_frame.grid()
         else:  # p2
             if choice == "human":
                 self.p2_computer.config(state="disabled")
                 self.p2_human.config(relief="sunken")
                 self.p2_strategy_var.set("")
-                for w in self.p2_strategy_frame.winfo_children():
-                    w.destroy()
+                self.p2_strategy_frame.grid_remove()
             else:
                 self.p2_human.config(state="disabled")
                 self.p2_computer.config(relief="sunken")
-                self.show_strategy_options("p2")
+                self.p2_strategy_frame.grid()
 
         self.update_start_button()
 
@@ -454,7 +523,12 @@ class GameSetup:
 
         ready_board = bool(self.board_file)
 
-        self.start_button.config(state="normal" if (p1_chosen and p2_chosen and p1_ok and p2_ok and ready_board) else "disabled")
+        state = "normal" if (p1_chosen and p2_chosen and p1_ok and p2_ok and ready_board) else "disabled"
+        # several paths can trigger this check for one click; only reconfigure the button on a real change
+        if state == self._start_state:
+            return
+        self._start_state = state
+        self.start_button.config(state=state)
 
     def create_players(self):
         """
@@ -484,33 +558,29 @@ class GameSetup:
         #full reproducibility
         if self.reproducible_var.get():
             random.seed(CONSTANT_SEED)
-            try:
-                import numpy as np
-                np.random.seed(CONSTANT_SEED)
-            except Exception:
-                pass  # in case numpy is not used; ignore if not present
+            np.random.seed(CONSTANT_SEED)
 
         self.p1, self.p2 = self.create_players()
         self.root.destroy()
 
     def clear_window(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # hide the current page; its widgets are kept for the next visit
+        if self._current_page is not None:
+            self._pages[self._current_page].pack_forget()
 
     def create_strategy(self, strategy_name):
-        match strategy_name:
-            case "random":
-                return RandomStrategy()
-            case "safe_choice":
-                return SafeChoiceStrategy()
-            case "greedy":
-                return GreedyStrategy()
-            case "MCTS":
-                return MCTSStrategy()
-            case "minimax":
-                return AlphaBetaStrategy()
-            case _:
-                raise ValueError(f"Unknown strategy: {strategy_name}")
+        strategy = _shared_instances.get(strategy_name)
+        if strategy is not None:
+            return strategy
+        entry = STRATEGY_REGISTRY.get(strategy_name)
+        if entry is None:
+            raise ValueError(f"Unknown strategy: {strategy_name}")
+        _, module_name, class_name = entry
+        cls = getattr(importlib.import_module(module_name), class_name)
+        strategy = cls()
+        if strategy_name in SHARED_STRATEGIES:
+            _shared_instances[strategy_name] = strategy
+        return strategy
 
     # Generates a quadratic Board according to the board size input
     def generate_board(self):
@@ -524,16 +594,18 @@ class GameSetup:
         if self.repro_checkbox:
             self.repro_checkbox.config(state="normal")
 
-        rnd = random.Random(CONSTANT_SEED) if self.reproducible_var.get() else random.Random()
-
-        matrix = [[rnd.randint(1,9) for _ in range(size)] for _ in range(size)]
+        # draw the whole board (values 1-9) in one call
+        rng = np.random.default_rng(CONSTANT_SEED if self.reproducible_var.get() else None)
+        matrix = rng.integers(1, 10, size=(size, size), dtype=np.int8)
         out_dir = "boards"
         os.makedirs(out_dir, exist_ok=True)
         path = os.path.join(out_dir, "board.txt")
 
+        # build the whole file text first and write it in one call (np.savetxt writes row by row)
+        text = "\n".join(" ".join(map(str, row)) for row in matrix.tolist())
         with open(path, "w", encoding="utf-8") as file:
-            for row in matrix:
-                file.write(" ".join(map(str, row)) + "\n")
+            file.write(text + "\n")
+        self.generated_matrix = matrix
 
         if self.repro_checkbox:
             self.repro_checkbox.config(state="disabled")
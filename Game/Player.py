@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Player:
     """ The Player class serves as a data structure and interface to represent a participant
         in the game, whether human or computer. It stores the player's identity and
@@ -13,6 +16,8 @@ class Player:
            the next row and column to click—to the associated `strategy` object. Human
            player moves are handled directly by the GUI (`Board`) and processed by the
            `GameHandler`.
+        5. Board Contract: strategies always receive the board as a read-only NumPy int8 array
+           in which 0 marks a taken cell; `move` converts other board formats once at this boundary.
         """
 
     def __init__(self, name="Player", is_human=True, strategy=None):
@@ -24,5 +29,21 @@ class Player:
     def getName(self):
         return self.name
 
+    @staticmethod
+    def as_board(matrix):
+        """
+        Return the board as a read-only int8 array with 0 on taken cells.
+        An int8 array is only wrapped in a read-only view (no copy); other boards (nested lists,
+        boards with '-' for taken cells) are converted once.
+        """
+        if isinstance(matrix, np.ndarray) and matrix.dtype == np.int8:
+            board = matrix.view()
+        else:
+            board = np.asarray(matrix, dtype=object)
+            board = np.where(board == "-", 0, board).astype(np.int8)
+        board.setflags(write=False)
+        return board
+
     def move(self, matrix, last_move=None, scores=(0, 0)):
-        return self.strategy.move(matrix, last_move, scores)
\ No newline at end of file
+        board = self.as_board(matrix)
+        return self.strategy.move(board, last_move, scores)
\ No newline at end of file
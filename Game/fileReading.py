@@ -1,6 +1,18 @@
 import os
+import io
+from functools import lru_cache
 import numpy as np
 
+# below this file size the line-wise parser beats np.loadtxt, whose setup cost dominates on small boards
+SMALL_FILE_BYTES = 4096
+# above this file size pandas' CSV reader beats np.loadtxt
+LARGE_FILE_BYTES = 1_000_000
+# read buffer for reading small and mid-sized files in one go (Python's default is 8 KiB)
+READ_BUFFER = 1 << 17
+# allowed cell values; 0 is reserved for taken cells (see Player.as_board)
+MIN_CELL_VALUE = 1
+MAX_CELL_VALUE = 9
+
 def load_board_until_ok(default_name="boards/board.txt"):
     """ The `fileReading` module safely loads and validates the initial game board matrix from a text file.
 
@@ -9,11 +21,14 @@ def load_board_until_ok(default_name="boards/board.txt"):
         filename until a valid file containing a square matrix of integers is successfully
         read. It first attempts to load a default file (`boards/board.txt`).
 
+        Programmatic callers (scripts, benchmarks) use `load_board`, which never prompts and raises on
+        any error; this loop is only the interactive wrapper around it.
+
         The core file parsing and validation logic resides in `open_file`, which checks for:
         1. File existence;
         2. Square dimensions;
         3. Consistent row lengths;
-        4. Numeric data (integers) in every cell.
+        4. Numeric data (integers from 1 to 9) in every cell.
 
         Upon success, it returns the data as a NumPy array for use by the main `GameHandler`.
         """
@@ -27,71 +42,152 @@ def load_board_until_ok(default_name="boards/board.txt"):
             tried_default = True
         else:
             # ask the user for a filename if default failed
-            name = input("Enter board filename (.txt optional): ").strip()
-            if not name:
+            candidate = input("Enter board filename (.txt optional): ").strip()
+            if not candidate:
                 print("Please enter a filename.\n")
                 continue
 
-            # allow input without .txt by adding extension if missing
-            root, ext = os.path.splitext(name)
-            candidate = name if ext else name + ".txt"
-
         try:
             # attempt to load and validate the selected file
-            return open_file(candidate)
+            return load_board(candidate)
         except (FileNotFoundError, ValueError, OSError) as e:
             # print the exact error type and message for debugging clarity
             print(f"{type(e).__name__}: {e}")
             print("Let's try again.\n")
 
 
+def load_board(name):
+    """
+    Load and validate one board file without any interaction and return it as an int8 matrix.
+    The .txt extension is optional. Raises FileNotFoundError / ValueError / OSError like `open_file`.
+    """
+    # allow names without .txt by adding the extension if missing
+    root, ext = os.path.splitext(name)
+    return open_file(name if ext else name + ".txt")
+
+
 def open_file(name):
     """
     Read a text file containing either whitespace- or comma-separated integers per line
-    and return a square NumPy matrix (dtype=object).
+    and return a square NumPy matrix (dtype=int8).
 
     Raises:
       - FileNotFoundError
-      - ValueError (for non-numeric data, inconsistent rows, non-square, empty)
+      - ValueError (for non-numeric data, inconsistent rows, non-square, empty, values outside 1-9)
       - OSError (other I/O issues)
     """
     #accept absolute or relative path
     # if the user gives a relative filename, prepend current working directory
     input_file_name = name if os.path.isabs(name) else os.path.join(os.getcwd(), name)
 
-    matrix_values = [] # store parsed rows before converting to numpy array
+    # parse each file version only once: the cache key includes the modification time (ns) and the size,
+    # so an edited or regenerated board is read again; hand out a copy so callers can't alter the cache
+    st = os.stat(input_file_name)
+    return _parse_board(os.path.abspath(input_file_name), st.st_mtime_ns, st.st_size).copy()
+
+
+@lru_cache(maxsize=8)
+def _parse_board(input_file_name, mtime_ns, size):
+    """Parse and validate the board file (mtime_ns is only part of the cache key)."""
+    # peek at the first non-empty line to pick the format: comma-separated or whitespace-separated
+    if size > LARGE_FILE_BYTES:
+        # huge files: only the first line is read here, pandas reads the file itself
+        with open(input_file_name, 'rt') as input_file:  # rt = read text
+            first = next((line for line in input_file if line.strip()), None)
+    else:
+        # small and mid-sized files are read into memory once, for the peek and the parse
+        with open(input_file_name, 'rt', buffering=READ_BUFFER) as input_file:
+            text = input_file.read()
+        lines = [line for line in text.splitlines() if line.strip()]
+        first = lines[0] if lines else None
+
+    if first is None:
+        raise ValueError("The file is empty.")   # no usable data found
 
-    with open(input_file_name, 'rt') as input_file:  # rt = read text
-        for line_number, line in enumerate(input_file, start=1):
-            stripped = line.strip()
-            if not stripped: # skip empty lines
-                continue
+    delimiter = ',' if ',' in first else None
 
-            #support two common formats: comma-separated or whitespace-separated
-            if ',' in stripped: parts = stripped.split(',')
-            else: parts = stripped.split()
+    # fail fast on a malformed board: a square board has as many rows as its first row has values,
+    # so a wrong row count is rejected before any value is parsed (huge files: parse at most n + 1 rows)
+    n = len(first.split(delimiter))
+    if size <= LARGE_FILE_BYTES and len(lines) != n:
+        raise ValueError("Matrix is not square (requires N×N).")
 
-            row = []
-            for value in parts:
-                value = value.strip()
-                try:
-                    row.append(int(value))   # ensure each entry is a valid integer
-                except ValueError:
-                    raise ValueError(f"Non-numeric value '{value}' on line {line_number}.")
-            matrix_values.append(row)
+    # mid-sized files: tokenizing and int conversion run in NumPy's C parser on the text already in memory;
+    # blank lines are skipped
+    # like the per-line format check, a file may mix comma- and whitespace-separated lines;
+    # np.loadtxt takes one delimiter for the whole file, so such files go through the line-wise parser
+    mixed = size <= LARGE_FILE_BYTES and any((',' in line) != (delimiter == ',') for line in lines)
+    try:
+        if size < SMALL_FILE_BYTES or mixed:
+            matrix = _parse_small(lines)
+        elif size > LARGE_FILE_BYTES:
+            matrix = _parse_large(input_file_name, delimiter, max_rows=n + 1)
+        else:
+            matrix = np.loadtxt(io.StringIO(text), delimiter=delimiter, dtype=np.int64, ndmin=2)
+    except ValueError as e:
+        # all parsers report non-numeric tokens and rows of different lengths as ValueError, but without
+        # the line: only now, on the error path, the file is scanned line by line to name the bad one
+        if size > LARGE_FILE_BYTES:
+            with open(input_file_name, 'rt') as input_file:
+                error = _find_bad_line(input_file)
+        else:
+            error = _find_bad_line(text.splitlines())
+        raise error or ValueError(f"Non-numeric value or inconsistent rows: {e}")
 
-    if not matrix_values:
-        raise ValueError("The file is empty.")   # no usable data found
+    # ensure the matrix is square
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Matrix is not square (requires N×N).")
 
-    row_length = len(matrix_values[0])  #reference length from the first row
+    # cell values are 1-9: the strategies see the board with 0 marking a taken cell, so a 0 (or any value
+    # outside the range) in the file would be mistaken for a used cell
+    if matrix.min() < MIN_CELL_VALUE or matrix.max() > MAX_CELL_VALUE:
+        raise ValueError(f"Values must lie between {MIN_CELL_VALUE} and {MAX_CELL_VALUE}.")
 
-    #ensure all rows have the same length
-    if any(len(row) != row_length for row in matrix_values):
-        raise ValueError("Rows have inconsistent lengths.")
+    return matrix.astype(np.int8)
 
-    # ensure the matrix is square
-    if len(matrix_values) != row_length:
-        raise ValueError("Matrix is not square (requires N×N).")
 
-    # Build NumPy array (dtype=object preserves formatting for game use)
-    return np.array(matrix_values, dtype=object)
+def _parse_small(lines):
+    """
+    Line-wise parser for the non-empty lines of a small board file: Python splits every line on its own
+    separator (comma if it has one, else whitespace), NumPy converts the tokens. Same errors as np.loadtxt.
+    """
+    # split each line once and let NumPy convert the string tokens in C (no int() call per token);
+    # non-numeric tokens and a ragged list raise ValueError here
+    rows = [line.split(',' if ',' in line else None) for line in lines]
+    return np.array(rows, dtype=np.int64, ndmin=2)
+
+
+def _find_bad_line(lines):
+    """
+    Line-by-line check of a board file that failed to parse; returns a ValueError naming the first
+    non-numeric value or row of a different length with its line number, or None if no line is bad.
+    """
+    row_length = None  # reference length from the first row
+    for line_number, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if not stripped:  # skip empty lines
+            continue
+        parts = stripped.split(',') if ',' in stripped else stripped.split()
+        for value in parts:
+            value = value.strip()
+            try:
+                int(value)
+            except ValueError:
+                return ValueError(f"Non-numeric value '{value}' on line {line_number}.")
+        if row_length is None:
+            row_length = len(parts)
+        elif len(parts) != row_length:
+            return ValueError(f"Row on line {line_number} has {len(parts)} values instead of {row_length}.")
+    return None
+
+
+def _parse_large(input_file_name, delimiter, max_rows=None):
+    """pandas parser for very large board files (at most max_rows rows); same result and errors as np.loadtxt."""
+    import pandas as pd  # only needed for huge boards, so it stays out of the game's start-up
+    try:
+        frame = pd.read_csv(input_file_name, header=None, sep=delimiter or r"\s+", dtype=np.int64,
+                            nrows=max_rows)
+    except pd.errors.ParserError as e:
+        # too many fields in a row; missing fields and non-numeric tokens already raise ValueError
+        raise ValueError(str(e))
+    return frame.to_numpy()
@@ -1,105 +1,202 @@
 import random
+import csv
 import numpy as np
 import pandas as pd
 import sys
 import os
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
 # need file to be able to see the Game and Strategies folders to run it driectly
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from Strategies.RandomStrategy import RandomStrategy
-from Strategies.GreedyStrategy import GreedyStrategy
+from Strategies.RandomStrategy import RandomStrategy, pick_random
+from Strategies.GreedyStrategy import GreedyStrategy, pick_greedy
 from Strategies.MCTS import MCTSStrategy
 from Strategies.safe_choice_strategy import SafeChoiceStrategy
 from Strategies.minimax_f import AlphaBetaStrategy
-from Game.Player import Player
+from Strategies.jit import njit
 
 #each random board is played twice to eliminate first-mover bias -> will have to swap roles
-games_per_board=2 
+games_per_board=2
+
+#strategies simple enough to be played entirely in compiled code (see _play); matchups of two of them skip
+#the Python move loop
+RANDOM_ID =0
+GREEDY_ID =1
+JIT_STRATEGY_IDS ={RandomStrategy: RANDOM_ID, GreedyStrategy: GREEDY_ID}
+
+
+#not cached on disk: numba's cache only checks this file, so it would miss changes to the strategies' kernels;
+#compiled on the first Random/Greedy game, so importing the module (e.g. in a pool worker) stays cheap
+@njit
+def _play(board, strategy_ids, uniforms):
+    """
+    play a whole game between two compiled strategies on board (modified in place, 0 = taken), with the
+    same kernels the strategy classes use; uniforms holds one random number per move.
+    Returns (p1_score, p2_score, last_r, last_c).
+    """
+    #64-bit sums: without numba, NumPy would keep int + int8 as int8 and wrap around on big boards
+    s1 =np.int64(0)
+    s2 =np.int64(0)
+    last_r =-1
+    last_c =-1
+    player =0
+    k =0
+    while True:
+        if strategy_ids[player] ==GREEDY_ID:
+            r, c =pick_greedy(board, last_r, last_c)
+        else:
+            r, c =pick_random(board, last_r, last_c, uniforms[k])
+        if r <0:
+            break
+        if player ==0:
+            s1 +=board[r, c]
+        else:
+            s2 +=board[r, c]
+        board[r, c] =0
+        last_r =r
+        last_c =c
+        player =1-player
+        k +=1
+    return s1, s2, last_r, last_c
+
 
 class SimulationEngine:
     """
     need a new class that can run an entire game from start to finish in memory, without opening any windows
     """
-    def __init__(self, player1, player2, board_matrix):
+    def __init__(self, strategy1, strategy2, board_matrix):
+        """
+        initializes a new game between two strategy objects (no Player wrapper needed headless)
+        """
+        self.dim = len(board_matrix)             #store dim of board
+        self.matrix =np.empty((self.dim, self.dim), dtype=np.int8)     #own int8 board to not modify original matrix, 0 = taken
+        #read-only view for the strategies (the board contract of Player.as_board), made once: it sees every move
+        self.board =self.matrix.view()
+        self.board.setflags(write=False)
+        self._moves_buf =np.empty((2*self.dim, 2), dtype=np.int16)    #reused scratch buffer for the row/column moves
+        self.reset(board_matrix, strategy1, strategy2)
+
+    def reset(self, board_matrix, strategy1, strategy2):
         """
-        initializes a new game 
+        start a new game on a board of the same size, reusing the engine's arrays
         """
-        self.players =[player1, player2]       #store players in list
-        self.matrix =np.copy(board_matrix)     #create copy of the board to not modify original matrix
-        self.dim = len(self.matrix)             #store dim of board
+        self.strategies =[strategy1, strategy2]      #store strategies in list, index = player
+        self.matrix[...] =board_matrix           #copy the board into the engine's own int8 array
         self.score=[0, 0]                     #initialize score count
         self.current_player=0                 #start game with player 1
         self.last_move =None                   #no moves yet-> initializes last move made with None
+        self._n_moves =0                       #number of valid entries in _moves_buf
 
     def get_available_moves(self):
         """
-        find all valid moves for the current player
+        find all valid moves for the current player, as an (n, 2) array of (row, col);
+        after the first move this is a view of a reused buffer, only valid until the next call
         """
-        moves =[]
-        
-        #   first move-> everything is possible-> iterate over entire board and assure no move already taken
+        matrix =self.matrix
+
+        #first move-> everything is possible-> every cell not taken yet, found in one NumPy scan
         if self.last_move is None:
-            for r in range(self.dim):
-                for c in range(self.dim):
-                    if self.matrix[r][c] !="-": #check if cell is not taken
-                        moves.append((r, c))
-            return moves
+            return np.argwhere(matrix)
 
         #subsequent moves: limited to row or column of the last move
         last_r, last_c =self.last_move
+        buf =self._moves_buf
 
-        #same column
-        for r in range(self.dim):
-            #check if cell is not taken
-            if self.matrix[r][last_c] !="-": 
-                moves.append((r, last_c))
+        #same column: free rows straight from the column slice
+        rows =np.flatnonzero(matrix[:, last_c])
+        k =len(rows)
+        buf[:k, 0] =rows
+        buf[:k, 1] =last_c
         #same row (avoid double-adding intersection)
-        for c in range(self.dim):
-            if c !=last_c and self.matrix[last_r][c] !="-": #skip the intersection cell if already added from column check
-                moves.append((last_r, c))
-        
-        return moves
+        cols =np.flatnonzero(matrix[last_r])
+        cols =cols[cols !=last_c]
+        n =k+len(cols)
+        buf[k:n, 0] =last_r
+        buf[k:n, 1] =cols
+
+        self._n_moves =n
+        return buf[:n]
+
+    def _legal(self, row, col):
+        """
+        True if (row, col) is a free cell in the row or column of the last move (anywhere on the first move)
+        """
+        if not (0 <=row <self.dim and 0 <=col <self.dim) or self.matrix[row, col] ==0:
+            return False
+        last =self.last_move
+        return last is None or row ==last[0] or col ==last[1]
 
     def run_game(self):
         """
         run until no moves are left, return final score and winner
         """
-
-        while True:
-            #find all moves based on current board
-            available_moves =self.get_available_moves()
-            
-            #if no moves available-> end
-            if not available_moves:
-                break
-
-            #get current player
-            player =self.players[self.current_player]
-
-            #ask AI strategy to choose a move 
-            move =player.move(self.matrix, self.last_move, self.score) 
-
-            #if move is non legal-> return VAlue Error
-            if move not in available_moves:
-                raise ValueError(f"Non-available move by player {self.current_player}.")
-                        
-            #devide returned move in coordinates
-            row, col =move
-
-            #get value from chosen move and add to player's score
-            value = self.matrix[row][col]
-            self.score[self.current_player] +=value
-            
-            #mark cell as taken and store the move as last taken move
-            self.matrix[row][col] ="-" 
-            self.last_move =(row, col)
-
-            #switch players
-            self.current_player = 1-self.current_player 
-
-
+        #both strategies compiled-> play the whole game in one call
+        ids =[JIT_STRATEGY_IDS.get(type(strategy)) for strategy in self.strategies]
+        if None not in ids and self.last_move is None:
+            return self._run_game_jit(ids)
+
+        #bind the state to locals for the loop (local lookups are cheaper than attribute lookups),
+        #the scalar state is written back when the loop ends
+        matrix =self.matrix
+        board =self.board
+        score =self.score
+        cur =self.current_player
+        last =self.last_move
+        get_available_moves =self.get_available_moves
+        legal =self._legal
+        #bound move methods of both strategies
+        moves =[strategy.move for strategy in self.strategies]
+
+        try:
+            while True:
+                #find all moves based on current board
+                available_moves =get_available_moves()
+
+                #if no moves available-> end
+                if not len(available_moves):
+                    break
+
+                #ask AI strategy of the current player to choose a move
+                move =moves[cur](board, last, score)
+
+                #if move is non legal-> return VAlue Error; checked on the board in O(1), no scan of the moves
+                if move is None or not legal(*move):
+                    raise ValueError(f"Non-available move by player {cur}.")
+
+                #devide returned move in coordinates
+                row, col =move
+
+                #get value from chosen move and add to player's score
+                score[cur] +=int(matrix[row, col])
+
+                #mark cell as taken and store the move as last taken move
+                matrix[row, col] =0
+                last =(row, col)
+                self.last_move =last     #get_available_moves and _legal read it
+
+                #switch players
+                cur =1-cur
+        finally:
+            self.current_player =cur
+            self.last_move =last
+
+        return self._result()
+
+    def _run_game_jit(self, ids):
+        """
+        run_game for two compiled strategies (see _play); numpy's global generator provides the random numbers
+        """
+        uniforms =np.random.random(self.dim*self.dim+1)   #at most one per cell, plus the final check
+        s1, s2, last_r, last_c =_play(self.matrix, np.array(ids), uniforms)
+        self.score =[int(s1), int(s2)]
+        if last_r >=0:
+            self.last_move =(int(last_r), int(last_c))
+        return self._result()
+
+    def _result(self):
         #left loop-> can determine a winner
         p1_score, p2_score = self.score
         
@@ -113,31 +210,47 @@ class SimulationEngine:
         return {"p1_score": p1_score, "p2_score": p2_score, "winner": winner}
     
 
-def create_random_board(size: int) -> np.ndarray:
+#module-wide generator for boards when the caller doesn't pass its own
+_RNG =np.random.default_rng()
+
+def create_random_board(size: int, rng=None) -> np.ndarray:
     """
     geenerate random NxN board for the simulation
     """
-    #create list of lists for game 
-    matrix =[[random.randint(1, 9) for row in range(size)] for col in range(size)]
-    #convert to array with object type, so will be able to store '-' for used fields
-    return np.array(matrix, dtype=object) 
+    #values 1-9 as a compact int8 array, drawn in one vectorized call; taken fields are later set to 0
+    return (rng or _RNG).integers(1, 10, size=(size, size), dtype=np.int8)
+
+def create_random_boards(size: int, n_boards: int, rng=None) -> np.ndarray:
+    """
+    generate n_boards random NxN boards at once as one (n_boards, size, size) int8 array
+    """
+    return (rng or _RNG).integers(1, 10, size=(n_boards, size, size), dtype=np.int8)
+
+#strategy names used in the simulation-> strategy classes
+STRATEGY_CLASSES ={
+    "Random": RandomStrategy,
+    "Greedy": GreedyStrategy,
+    "SafeChoice": SafeChoiceStrategy,
+    "MCTS": MCTSStrategy,
+    "Minimax": AlphaBetaStrategy,
+}
 
 def create_strategy(name: str):
     """
     match string names to the strategies
     """
-    if name =="Random": return RandomStrategy()
-    if name =="Greedy": return GreedyStrategy()
-    if name == "SafeChoice": return SafeChoiceStrategy()
-    if name =="MCTS": return MCTSStrategy()
-    if name =="Minimax": return AlphaBetaStrategy()
-    raise ValueError(f"{name}-strategy not existent for game")
+    strategy_class =STRATEGY_CLASSES.get(name)
+    if strategy_class is None:
+        raise ValueError(f"{name}-strategy not existent for game")
+    return strategy_class()
 
 
 class SimulationRunner:
-    def __init__(self, number_of_simulations=None, strategies=None, board_dims=None, boards_per_size=None): # New boards_per_size parameter
+    def __init__(self, number_of_simulations=None, strategies=None, board_dims=None, boards_per_size=None, seed=None,
+                 results_file="simulation_results2.csv"): # New boards_per_size parameter
         """
-        initialize one simulation run
+        initialize one simulation run; seed makes the boards and the per-matchup seeds reproducible,
+        results_file is the csv in the 'results' subfolder the matchup results are written to
         """
         if strategies is None:
             strategies =["Random", "Greedy", "SafeChoice", "MCTS", "Minimax"]
@@ -152,9 +265,10 @@ class SimulationRunner:
 
         self.strategies = strategies                   #which strategies to be used
         self.number_of_simulations = number_of_simulations #kept for legacy, but board_per_size dictates counts now
-        self.results =[]                              #initialize list with results (Win, Loss, Tie)
+        self.results_path =os.path.join(current_dir, "results", results_file)   #csv with one row per matchup (Win, Loss, Tie)
         self.board_dim= board_dims
         self.boards_per_size=boards_per_size         #store the new board counts per dimension
+        self.rng =np.random.default_rng(seed)        #generator for the boards and the matchup seeds
 
     def run_match(self, board_dim, P1_strat, P2_strat, set_of_boards):
         """
@@ -169,14 +283,22 @@ class SimulationRunner:
         #track first-mover advantage
         starter_wins = 0 
 
+        #create both strategies once per matchup instead of once per game;
+        #they just swap roles between game 1 and game 2
+        strategy1 =create_strategy(P1_strat)
+        strategy2 =create_strategy(P2_strat)
+        #one engine plays all games of the matchup, reset to the next board and roles each time
+        if len(set_of_boards):
+            engine =SimulationEngine(strategy1, strategy2, set_of_boards[0])
+
         #iterate through generated boards, so that the strategies can play the exact same boards twice 
         for board in set_of_boards:
             #Game 1: S1=P1 (-> is starter), S2=P2
-            #set up game with random board, creating player with their strategies
-            engine1 = SimulationEngine(Player(P1_strat, False, create_strategy(P1_strat)),Player(P2_strat, False, create_strategy(P2_strat)),np.copy(board))
-            
+            #set up game with random board
+            engine.reset(board, strategy1, strategy2)   #the engine copies the board into its own int8 array
+
             #run game simulation to completion
-            r1 = engine1.run_game()
+            r1 = engine.run_game()
         
             if r1["winner"] =="P1":        #S1 wins as P1
                 S1_wins_as_P1 +=1
@@ -187,8 +309,8 @@ class SimulationRunner:
                 ties += 1
 
             #Game 2: S2=P1, S1=P2
-            engine2 = SimulationEngine(Player(P2_strat, False, create_strategy(P2_strat)),Player(P1_strat, False, create_strategy(P1_strat)),np.copy(board) )
-            r2 = engine2.run_game()
+            engine.reset(board, strategy2, strategy1)
+            r2 = engine.run_game()
 
             if r2["winner"]== "P1":        #S2 wins as P1
                 S2_wins_as_P1 +=1
@@ -233,65 +355,80 @@ class SimulationRunner:
         }
 
 
-    def run_iteration(self):
+    def run_iteration(self, max_workers=None):
         """
-        iterate through board dimensions and strategies
+        iterate through board dimensions and strategies; the matchups are independent of each other
+        and run in parallel on max_workers processes (default: one per core). Each matchup's row is
+        appended to results_path as it finishes; returns results_path
         """
         #check if boards_per_size is defined for all dimensions
         missing = [s for s in self.board_dim if s not in self.boards_per_size]
         if missing:
             raise KeyError(f"missing boards_per_size entries for sizes: {missing}")
         
+        #collect all matchups first: boards and seeds are drawn here, in a fixed order, so a seeded run
+        #gives the same results no matter how the matchups are spread over the processes
+        jobs =[]
         for size in self.board_dim:
             #use the determined number of boards for the size
             n_boards = self.boards_per_size[size] 
             
-            #generate all boards per size to ensure fair match ups
-            boards_set = [create_random_board(size) for _ in range(n_boards)] 
-
-            #iterate through strategies, while avoiding duplicate pairs (A,B) and (B,A)
-            for index1, s1 in enumerate(self.strategies):
-                for index2, s2 in enumerate(self.strategies):
-                    #avoid duplication
-                    if index1>=index2:
-                        continue
-                    
-                    #run the games on fixed boards for fairness
-                    data =self.run_match(size, s1, s2, boards_set)
-                    #append the generated results to the result list
-                    if data:
-                        self.results.append(data)
-    
-    def save_results(self, filename="simulation_results2.csv"): 
+            #generate all boards per size to ensure fair match ups; one (n_boards, size, size) int8 array from
+            #a single generator call, so every board handed to a game is a view and the engine's copy is a single memcpy
+            boards_set = create_random_boards(size, n_boards, self.rng)
+
+            #iterate through strategy pairs, each unordered pair (A,B) once and in list order
+            for s1, s2 in combinations(self.strategies, 2):
+                #run the games on fixed boards for fairness, with an own random seed per matchup
+                jobs.append((size, s1, s2, boards_set, int(self.rng.integers(2**31))))
+
+        #define directory to save in 'results' subfolder
+        os.makedirs(os.path.dirname(self.results_path), exist_ok=True)
+
+        with open(self.results_path, "w", newline="") as out, \
+                ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            writer =None
+            #map keeps the results in job order
+            for data in pool.map(self._run_match_job, jobs):
+                #write each matchup's row as soon as it is done (the csv doubles as a progress checkpoint)
+                if data:
+                    if writer is None:
+                        writer =csv.DictWriter(out, fieldnames=list(data))
+                        writer.writeheader()
+                    writer.writerow(data)
+                    out.flush()
+        return self.results_path
+
+    def _run_match_job(self, job):
         """
-        saves the simulation results as csv and exports
+        run_match in a worker process: seed the generators the strategies and the compiled games use first
         """
-        df =pd.DataFrame(self.results)
-        #define directory to save in 'results' subfolder
-        out_dir =os.path.join(current_dir, "results") 
-        os.makedirs(out_dir, exist_ok=True)
-        
-        csv_path= os.path.join(out_dir, filename)
-        df.to_csv(csv_path, index=False)
-        return csv_path
+        size, s1, s2, boards_set, seed =job
+        random.seed(seed)
+        np.random.seed(seed)
+        return self.run_match(size, s1, s2, boards_set)
+
 
 def aggregate_per_strategy(csv_path: str, out_name="strategy_summary.csv"):
     """Aggregate overall per-strategy win rates as P1 and as P2 across all opponents & sizes."""
     df =pd.read_csv(csv_path)
 
-    #wins when the strategy appears as S1 (P1/P2) + when it appears as S2 (P1/P2)
-    wins_as_P1 =(df.groupby("S1")["S1_wins_as_P1"].sum().add(df.groupby("S2")["S2_wins_as_P1"].sum(), fill_value=0))
-    wins_as_P2 = (df.groupby("S1")["S1_wins_as_P2"].sum().add(df.groupby("S2")["S2_wins_as_P2"].sum(), fill_value=0))
-    
-    #each matchup contributes exactly one game as P1 and one as P2 per board
-    games_as_P1 =(df.groupby("S1")["boards"].sum().add(df.groupby("S2")["boards"].sum(), fill_value=0))
+    #one long table with a row per (matchup, side): the strategy's wins as P1/P2 and its boards,
+    #so a single groupby sums the S1 and the S2 appearances together; the strategy column keeps the name "S1",
+    #which is the index header of the summary csv
+    side_columns =["S1", "wins_as_P1", "wins_as_P2", "boards"]
+    long =pd.concat([
+        df[["S1", "S1_wins_as_P1", "S1_wins_as_P2", "boards"]].set_axis(side_columns, axis=1),
+        df[["S2", "S2_wins_as_P1", "S2_wins_as_P2", "boards"]].set_axis(side_columns, axis=1),
+    ], ignore_index=True)
+    totals =long.groupby("S1")[["wins_as_P1", "wins_as_P2", "boards"]].sum()
 
-    #symmetric by design-> just make copy
-    games_as_P2 =games_as_P1.copy()  
+    #each matchup contributes exactly one game as P1 and one as P2 per board-> symmetric by design
+    games =totals["boards"]
 
-    summary =pd.DataFrame({"wins_as_P1": wins_as_P1.astype(int), "games_as_P1": games_as_P1.astype(int),"win_rate_as_P1": wins_as_P1 / games_as_P1,
-        "wins_as_P2": wins_as_P2.astype(int), "games_as_P2": games_as_P2.astype(int),
-        "win_rate_as_P2": wins_as_P2 / games_as_P2,}).sort_values(["win_rate_as_P1", "win_rate_as_P2"], ascending=False)
+    summary =pd.DataFrame({"wins_as_P1": totals["wins_as_P1"], "games_as_P1": games, "win_rate_as_P1": totals["wins_as_P1"] / games,
+        "wins_as_P2": totals["wins_as_P2"], "games_as_P2": games,
+        "win_rate_as_P2": totals["wins_as_P2"] / games,}).sort_values(["win_rate_as_P1", "win_rate_as_P2"], ascending=False)
 
     out_dir =os.path.join(current_dir, "results")
     os.makedirs(out_dir, exist_ok=True)
@@ -319,7 +456,7 @@ if __name__ =="__main__":
         board_dims=[3, 5, 6, 8, 9],
         boards_per_size = {3: 132, 5: 132, 6: 132, 8: 132, 9: 132} #set based on 97% CI calculation
     )
-    runner.run_iteration()
-    results_csv = runner.save_results()
+    #the results are written to csv while the matchups finish
+    results_csv = runner.run_iteration()
     #aggregate overall results per strategy for a final summary
     aggregate_per_strategy(results_csv)
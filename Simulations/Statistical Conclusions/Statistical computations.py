@@ -12,23 +12,30 @@ csv_path= os.path.normpath(os.path.join(script_dir, "..", "Results", "simulation
 
 csv= pd.read_csv(csv_path)
 strategies= ['Greedy', 'MCTS', 'Minimax', 'Random', 'SafeChoice']
+board_size= [3,5,6,8,9]
 
 
-"TABLE: Win rate per strategy"
+"Long format: every matchup once from S1's and once from S2's point of view"
 
-print("\n\033[1m      Win Rate per Strategy \033[0m")
+#one row per (matchup, strategy) -> the per-strategy tables below are single groupbys instead of filter loops
+s1_wins= csv["S1_wins_as_P1"]+ csv["S1_wins_as_P2"]
+s2_wins= csv["S2_wins_as_P1"]+ csv["S2_wins_as_P2"]
+long= pd.concat([csv.assign(strategy=csv["S1"], wins=s1_wins, losses=s2_wins),
+                 csv.assign(strategy=csv["S2"], wins=s2_wins, losses=s1_wins)], ignore_index=True)
+long["starter_wins"]= long["starter_win_rate"]* long["total_games_matchup"]
+
+#totals per strategy and per (strategy, board size); strategies or sizes without games are kept as zero rows
+totals= long.groupby("strategy")[["wins", "losses", "ties", "total_games_matchup"]].sum().reindex(strategies, fill_value=0)
+by_size= (long.groupby(["strategy", "board_size"])[["wins", "losses", "starter_wins", "total_games_matchup"]].sum()
+          .reindex(pd.MultiIndex.from_product([strategies, board_size], names=["strategy", "board_size"]), fill_value=0))
 
-rows= []
-for strategy in strategies:
-    s1= csv[csv["S1"]== strategy]
-    s2= csv[csv["S2"]== strategy]
 
-    wins= (s1["S1_wins_as_P1"].sum()+ s1["S1_wins_as_P2"].sum()+ s2["S2_wins_as_P1"].sum()+ s2["S2_wins_as_P2"].sum()) #tot number of wins
-    losses= (s1["S2_wins_as_P1"].sum()+ s1["S2_wins_as_P2"].sum()+ s2["S1_wins_as_P1"].sum()+ s2["S1_wins_as_P2"].sum()) #tot number of losses
-    n= wins + losses #tot number of games
-    rows.append({"strategy": strategy, "wins": wins, "losses": losses, "win_rate": wins / n if n else None})
+"TABLE: Win rate per strategy"
+
+print("\n\033[1m      Win Rate per Strategy \033[0m")
 
-results= pd.DataFrame(rows).sort_values("win_rate", ascending=False)
+n= totals["wins"]+ totals["losses"] #tot number of games without ties
+results= totals[["wins", "losses"]].assign(win_rate=totals["wins"]/ n.where(n > 0)).reset_index().sort_values("win_rate", ascending=False)
 print(results)
 
 
@@ -64,17 +71,8 @@ plt.ylabel("Strategy")
 
 "PLOT: stacked bar chart of tot win, loss and tie for strategy"
 
-records = []
-for strategy in strategies:
-    s1= csv[csv["S1"]== strategy]
-    s2= csv[csv["S2"]== strategy]
-    wins= s1["S1_wins_as_P1"].sum()+ s1["S1_wins_as_P2"].sum()+ s2["S2_wins_as_P1"].sum()+ s2["S2_wins_as_P2"].sum()
-    losses= s1["S2_wins_as_P1"].sum()+ s1["S2_wins_as_P2"].sum()+ s2["S1_wins_as_P1"].sum()+ s2["S1_wins_as_P2"].sum()
-    ties= s1["ties"].sum()+ s2["ties"].sum()
-    total= wins+ losses+ ties
-    records.append({"strategy": strategy, "win_rate": wins/total, "tie_rate": ties/total, "loss_rate": losses/total})
-
-agg= pd.DataFrame(records).set_index("strategy")
+total= totals["wins"]+ totals["losses"]+ totals["ties"]
+agg= pd.DataFrame({"win_rate": totals["wins"]/total, "tie_rate": totals["ties"]/total, "loss_rate": totals["losses"]/total})
 
 #Plot stacked bars
 fig, ax= plt.subplots(figsize=(8,5))
@@ -127,22 +125,8 @@ plt.show()
 
 print("\n\033[1m      Win rates of Strategies relatively to board size \033[0m")
 
-records= []
-board_size= [3,5,6,8,9]
-for strategy in strategies:
-    for size in board_size:
-
-        s1= csv[(csv["S1"]== strategy)&(csv["board_size"]==size)]
-        s2= csv[(csv["S2"]== strategy)&(csv["board_size"]==size)]
-
-        wins= (s1["S1_wins_as_P1"].sum() + s1["S1_wins_as_P2"].sum()+s2["S2_wins_as_P1"].sum() +s2["S2_wins_as_P2"].sum())
-        losses= (s1["S2_wins_as_P1"].sum() + s1["S2_wins_as_P2"].sum()+s2["S1_wins_as_P1"].sum()+s2["S1_wins_as_P2"].sum())
-
-        total=wins+losses
-        win_rate= wins/ total if total > 0 else None
-        records.append({"strategy": strategy, "board_size": size, "win_rate": win_rate})
-
-win_rates= pd.DataFrame(records)
+total= by_size["wins"]+ by_size["losses"]
+win_rates= (by_size["wins"]/ total.where(total > 0)).rename("win_rate").reset_index()
 print(win_rates)
 
 
@@ -171,16 +155,9 @@ plt.legend(title="Strategy")
 "TABLE: Tie rate"
 
 print("\n\033[1m      Tie rate \033[0m")
-rows = []
-for strategy in strategies:
-    s1= csv[csv["S1"]==strategy]
-    s2=csv[csv["S2"] ==strategy]
-    ties= int(s1["ties"].sum()+s2["ties"].sum())
-    total_games= int(s1["total_games_matchup"].sum()+s2["total_games_matchup"].sum())
-    tie_rate= ties/total_games if total_games>0 else float("nan")
-    rows.append({"strategy":strategy, "ties":ties, "total_games":total_games, "tie_rate":tie_rate})
-
-tie= pd.DataFrame(rows).sort_values("tie_rate", ascending=False)
+tie= totals[["ties", "total_games_matchup"]].rename(columns={"total_games_matchup": "total_games"})
+tie["tie_rate"]= tie["ties"]/ tie["total_games"].where(tie["total_games"] > 0)
+tie= tie.reset_index().sort_values("tie_rate", ascending=False)
 print(tie)
 
 
@@ -188,15 +165,9 @@ print(tie)
 
 print("\n\033[1m      First move advantage \033[0m")
 
-records= []
-for strategy in strategies:
-    for size in board_size:
-        subset= csv[((csv["S1"]== strategy)|(csv["S2"] == strategy)) &(csv["board_size"] == size)]
-        total_games= subset["total_games_matchup"].sum()
-        starter_win_rate= np.average(subset["starter_win_rate"], weights=subset["total_games_matchup"])
-        records.append({"strategy": strategy, "board_size": size,"starter_win_rate": starter_win_rate, "total_games": total_games})
-
-first_move_by_strategy_size= pd.DataFrame(records)
+#starter win rate of the strategy's matchups, weighted by the games per matchup
+first_move_by_strategy_size= pd.DataFrame({"starter_win_rate": by_size["starter_wins"]/ by_size["total_games_matchup"],
+                                           "total_games": by_size["total_games_matchup"]}).reset_index()
 
 #Sort and display results
 first_move_by_strategy_size= first_move_by_strategy_size.sort_values(["strategy","board_size"]).reset_index(drop=True)
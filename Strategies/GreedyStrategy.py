@@ -1,4 +1,27 @@
+import numpy as np
 from Strategies.Strategy import Strategy
+from Strategies.jit import njit
+
+
+@njit(cache=True)
+def pick_greedy(board, last_r, last_c):
+    """
+    Legal cell with the highest value (the first one in row-major order on ties): any cell not taken yet
+    (value != 0) on the first move (last_r < 0), afterwards one in row last_r or column last_c.
+    Returns (-1, -1) if there is none. Also used by the compiled simulation games (SimulationHandler._play).
+    """
+    n = board.shape[0]
+    best_r = -1
+    best_c = -1
+    best_v = 0
+    for r in range(n):
+        for c in range(n):
+            if board[r, c] != 0 and (last_r < 0 or r == last_r or c == last_c):
+                if best_r < 0 or board[r, c] > best_v:
+                    best_v = board[r, c]
+                    best_r = r
+                    best_c = c
+    return best_r, best_c
 
 
 class GreedyStrategy(Strategy):
@@ -9,37 +32,23 @@ class GreedyStrategy(Strategy):
     def move(self, matrix, last_move, scores):
         """
         Parameters
-        matrix : list of lists
-            The current board.
+        matrix : np.ndarray (int8, read-only)
+            The current board, 0 marks a taken cell.
         last_move : tuple or None
             The (row, col) of the previous move.
             If None (first turn), pick any available cell.
         """
 
-        n= len(matrix)
-
         #Case 1: first move (no restrictions)
         if last_move is None:
             print("first turn")
-            available= [(r, c)
-                for r in range(n)
-                for c in range(n)
-                if matrix[r][c] != '-']
+            r0, c0 = -1, -1
         else:
-            r0, c0 = last_move
-
             #Case 2: only pick in the same row or column
-            available= [(r, c)
-                for r in range(n)
-                for c in range(n)
-                if matrix[r][c] != '-' and (r == r0 or c == c0)]
+            r0, c0 = last_move
 
-        if not available:
+        #Pick the highest valid cell (one compiled scan of the board)
+        r, c = pick_greedy(np.asarray(matrix), r0, c0)
+        if r < 0:
             return None  #no valid move left
-
-        #Pick the highest valid cell
-
-        out= max(available, key=lambda pos: float(matrix[pos[0]][pos[1]]))
-        return out
-
-
+        return (int(r), int(c))
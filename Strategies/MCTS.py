@@ -3,6 +3,7 @@ import random
 import sys
 import os
 import time
+import numpy as np
 
 #look for "Strategy" in the parent directory
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -170,9 +171,32 @@ class MCTSStrategy(Strategy):
         """
         Analyzes the current game state and returns the best move.
         """
+        root =self._search(board, last_move, scores)
 
-        #until now have used 0 for used moves, but in gamehandler is a "-" -> convert:
-        internal_board =[[0 if cell=="-" else cell for cell in row] for row in board]
+        #trivial moves (no search was run): if no move available return None, and if only 1 move available choose that
+        if not root.children:
+            return root.untried_actions[0] if root.untried_actions else None
+
+        #select child with highest visit count -> most robust move when time is short
+        best_child =max(root.children, key=lambda c: c.visits)
+        return best_child.move
+
+    def root_visits(self, board, last_move, scores):
+        """
+        Runs one search and returns the visit count of every root move,
+        so independent searches can be merged (root parallelization, see run_rollouts).
+        """
+        root =self._search(board, last_move, scores)
+        if not root.children:
+            return {move: 1 for move in root.untried_actions}
+        return {child.move: child.visits for child in root.children}
+
+    def _search(self, board, last_move, scores):
+        """
+        Builds the search tree for the current game state until the time runs out and returns its root.
+        """
+        #board arrives as an int8 array with 0 for used moves -> plain Python ints, so scores can't overflow
+        internal_board =np.asarray(board).tolist()
 
         #calculate total sum available on board -> used to normalize score later
         total_sum =sum(v for row in internal_board for v in row if v>0) or 1
@@ -187,11 +211,9 @@ class MCTSStrategy(Strategy):
         #create root node= current state of real game
         root =MCTSNode(board=internal_board, last_move=last_move, player_turn=player_id, scores=tuple(scores))
 
-        #trivial moves: if no move available return None, and if only 1 move available choose that without simulating
-        if not root.untried_actions:
-            return None
-        if len(root.untried_actions) ==1:
-            return root.untried_actions[0]
+        #trivial moves: with 0 or 1 available moves there is nothing to simulate
+        if len(root.untried_actions) <=1:
+            return root
         
         #repeat 4 steps of MCTS as many times as possible-> until the time runs out
         while (time.time()-start_time< self.time_limit):
@@ -212,9 +234,7 @@ class MCTSStrategy(Strategy):
             #Backpropagation: AI traces its steps back up the tree, back o root
             self.backpropagate(node, result)
 
-        #select child with highest visit count -> most robust move when time is short
-        best_child =max(root.children, key=lambda c: c.visits)
-        return best_child.move
+        return root
 
     def simulate(self, node, total_sum):
         """
@@ -294,7 +314,12 @@ class MCTSStrategy(Strategy):
             current_node =current_node.parent
 
 
-
-
-
-
+def run_rollouts(args):
+    """
+    One independent MCTS search for root parallelization, meant to run in a worker process.
+    args =(board, last_move, scores, time_limit, seed); returns the visit count of every root move.
+    """
+    board, last_move, scores, time_limit, seed =args
+    #every worker explores with its own random stream
+    random.seed(seed)
+    return MCTSStrategy(time_limit=time_limit).root_visits(board, last_move, scores)
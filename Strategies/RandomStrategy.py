@@ -1,5 +1,59 @@
 import random as rd
+import numpy as np
 from Strategies.Strategy import Strategy
+from Strategies.jit import njit
+
+
+@njit(cache=True)
+def pick_random(board, last_r, last_c, u):
+    """
+    Legal cell chosen uniformly by u in [0, 1): any cell not taken yet (value != 0) on the first move
+    (last_r < 0), afterwards one in row last_r or column last_c.
+    Returns (-1, -1) if there is none. Also used by the compiled simulation games (SimulationHandler._play).
+    """
+    n = board.shape[0]
+    if last_r < 0:
+        # first move: count the free cells of the whole board, then walk them again and stop at the k-th one
+        count = 0
+        for r in range(n):
+            for c in range(n):
+                if board[r, c] != 0:
+                    count += 1
+        if count == 0:
+            return -1, -1
+        k = int(u * count)
+        for r in range(n):
+            for c in range(n):
+                if board[r, c] != 0:
+                    if k == 0:
+                        return r, c
+                    k -= 1
+        return -1, -1
+
+    # count the free cells of the row and of the column (without the crossing cell twice)
+    count = 0
+    for c in range(n):
+        if board[last_r, c] != 0:
+            count += 1
+    for r in range(n):
+        if r != last_r and board[r, last_c] != 0:
+            count += 1
+    if count == 0:
+        return -1, -1
+
+    # walk the same cells again and stop at the k-th free one
+    k = int(u * count)
+    for c in range(n):
+        if board[last_r, c] != 0:
+            if k == 0:
+                return last_r, c
+            k -= 1
+    for r in range(n):
+        if r != last_r and board[r, last_c] != 0:
+            if k == 0:
+                return r, last_c
+            k -= 1
+    return -1, -1
 
 
 class RandomStrategy(Strategy):
@@ -14,47 +68,37 @@ class RandomStrategy(Strategy):
         2. Subsequent Turns: Otherwise, only unoccupied cells that share the same
            row or the same column as the `last_move` are available.
 
-        From this filtered list of valid moves, the strategy uses Python's `random` module
-        to make an unbiased, non-optimal selection, ensuring the move adheres to the game's constraints.
+        The available cells are scanned by `pick_random` (JIT-compiled with numba when it is installed; after
+        the first turn only the row and column of the last move), and one uniform draw from the strategy's own
+        `random.Random` is used to make an unbiased, non-optimal selection, ensuring the move adheres to the game's constraints.
         It returns the chosen `(row, col)` tuple, or `None` if no legal moves remain.
         """
 
+    def __init__(self, seed=None):
+        # own generator per instance, so parallel games don't share the global `random` state;
+        # without a seed it is drawn from the global `random`, so random.seed(...) still reproduces a game
+        self._rng = rd.Random(seed if seed is not None else rd.getrandbits(64))
+
     def move(self, matrix,last_move, scores):
         """
         Parameters
-        matrix : list of lists
-            The current board.
+        matrix : np.ndarray (int8, read-only)
+            The current board, 0 marks a taken cell.
         last_move : tuple or None
             The (row, col) of the previous move.
             If None (first turn), pick any available cell.
         """
 
-        n = len(matrix)
-
         # case 1: first move, without restrictions
         if last_move is None:
             print("first turn")
-            available = [
-                (r, c)
-                for r in range(n)
-                for c in range(n)
-                if matrix[r][c] != '-'
-            ]
+            r0, c0 = -1, -1
         else:
-            r0, c0 = last_move
             # case 2 : only pick in the same row or column
-            available = [
-                (r, c)
-                for r in range(n)
-                for c in range(n)
-                if matrix[r][c] != '-' and (r == r0 or c == c0)
-            ]
-
-        if not available:
-            return None  # no valid move left
-
-        # Pick a random valid cell
-        out=rd.choice(available)
-        return out
-    
+            r0, c0 = last_move
 
+        # one compiled scan of the legal cells and one uniform draw from the strategy's own generator
+        r, c = pick_random(np.asarray(matrix), r0, c0, self._rng.random())
+        if r < 0:
+            return None  # no valid move left
+        return (int(r), int(c))
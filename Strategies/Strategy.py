@@ -2,6 +2,7 @@ class Strategy:
     """
     Base class for game strategies
     Every substrategy has to implement the method move
+    The board passed to move is a read-only NumPy int8 array, 0 marks a taken cell (see Player.as_board)
     """
     def move(self, matrix,last_move):
         raise NotImplementedError("You must implement the method move()")
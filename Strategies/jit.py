@@ -0,0 +1,8 @@
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the functions decorated with njit simply run as plain Python/NumPy code
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
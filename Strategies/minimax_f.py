@@ -3,6 +3,7 @@ from copy import deepcopy
 import sys
 import os
 from typing import List, Optional, Tuple
+import numpy as np
 
 # Look for "Strategy" in the parent directory (your original structure)
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -147,8 +148,8 @@ class AlphaBetaStrategy(Strategy):
         return max(1, d)
 
     def move(self, board, last_move, scores):
-        # normalize "-" -> 0
-        internal_board = [[0 if cell == "-" else cell for cell in row] for row in board]
+        # int8 array (0 = taken) -> lists of plain Python ints for the tree
+        internal_board = np.asarray(board).tolist()
 
         #whose turn?
         moves_made = sum(row.count(0) for row in internal_board)
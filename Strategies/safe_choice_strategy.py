@@ -1,8 +1,9 @@
 from typing import List, Optional, Tuple, Dict
+import numpy as np
 from Strategies.Strategy import Strategy
 
 Coord = Tuple[int, int]
-Matrix = List[List[object]]  # numbers or '-' for used cells
+Matrix = np.ndarray  # read-only int8 board, 0 for used cells
 
 
 class SafeChoiceStrategy(Strategy):
@@ -101,12 +102,12 @@ class SafeChoiceStrategy(Strategy):
     # helpers: validity & primitive values
     @staticmethod
     def _is_free(val: object) -> bool:
-        return val != '-'
+        return val != 0
 
     @staticmethod
     def _cell_value(matrix: Matrix, i: int, j: int) -> Optional[float]:
         val = matrix[i][j]
-        return None if val == '-' else float(val)
+        return None if val == 0 else float(val)
 
     def _valid_moves(self, matrix: Matrix, last_move: Optional[Coord]) -> List[Coord]:
         n = len(matrix)